@@ -9,7 +9,15 @@ if (!fs.existsSync(subfolder)) {
   fs.mkdirSync(subfolder);
 }
 
-const excludedFiles = [subfolder, "components", "build.js", ".github", ".git"];
+const excludedFiles = [
+  subfolder,
+  "components",
+  "build.js",
+  ".github",
+  ".git",
+  "tools",
+  "tests",
+];
 
 // Get all files and directories in the current folder
 const files = fs.readdirSync(".");
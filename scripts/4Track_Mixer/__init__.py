@@ -83,6 +83,7 @@ class Grid_mixer_and_launch_control(ControlSurface):
         # Rebuild all listeners
         self._clip_launcher.setup_clip_listeners()
         self._mixer_component.setup_track_listeners()
+        self.log_message("Track listeners registered: %d" % self._mixer_component.listener_count())
         
         # Update MIDI feedback
         self._mixer_component.set_track_offset(self.track_offset)
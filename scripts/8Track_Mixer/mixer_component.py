@@ -12,6 +12,7 @@ from .constants import (MAIN_CHANNEL, NUM_TRACKS, GRID_COLS,
                       MUTE_NOTE_START, SOLO_NOTE_START, ARM_NOTE_START,
                       VOLUME_CC_START_2, PAN_CC_START_2, SEND_A_CC_START_2, SEND_B_CC_START_2,
                       MUTE_NOTE_START_2, SOLO_NOTE_START_2, ARM_NOTE_START_2)
+from .listener_registry import ListenerRegistry
 
 
 class MixerComponent:
@@ -28,7 +29,7 @@ class MixerComponent:
         self._solo_buttons = []
         self._arm_buttons = []
         self._listener_refs = []
-        self._track_state_listeners = []
+        self._track_listeners = ListenerRegistry()  # One mute/solo/arm listener per track
         self._last_selected_track = None  # Track debounce
         self._last_selection_time = 0  # Timestamp of last selection
         
@@ -189,45 +190,24 @@ class MixerComponent:
         self.update_mix_leds()
     
     def setup_track_listeners(self):
-        """Setup track listeners for mute/solo/arm changes"""
+        """Setup track listeners for mute/solo/arm changes - safe to call repeatedly"""
+        callback = lambda: self.update_mix_leds()
+        
+        desired = []
         for track in self._parent.song().tracks:
-            def make_mute_cb():
-                return lambda: self.update_mix_leds()
-            
-            def make_solo_cb():
-                return lambda: self.update_mix_leds()
-            
-            def make_arm_cb():
-                return lambda: self.update_mix_leds()
-            
-            mute_cb = make_mute_cb()
-            solo_cb = make_solo_cb()
-            arm_cb = make_arm_cb()
-            
-            if not track.mute_has_listener(mute_cb):
-                track.add_mute_listener(mute_cb)
-                self._track_state_listeners.append((track, 'mute', mute_cb))
-            
-            if not track.solo_has_listener(solo_cb):
-                track.add_solo_listener(solo_cb)
-                self._track_state_listeners.append((track, 'solo', solo_cb))
-            
+            desired.append((track, 'mute', callback))
+            desired.append((track, 'solo', callback))
             # Add ARM listener (for audio/MIDI tracks)
-            if track.can_be_armed and not track.arm_has_listener(arm_cb):
-                track.add_arm_listener(arm_cb)
-                self._track_state_listeners.append((track, 'arm', arm_cb))
+            if track.can_be_armed:
+                desired.append((track, 'arm', callback))
+        
+        # Already registered listeners are kept, deleted tracks are dropped
+        self._track_listeners.sync(desired)
+    
+    def listener_count(self):
+        """Number of registered track listeners"""
+        return self._track_listeners.count()
     
     def disconnect(self):
         """Cleanup on disconnect"""
-        for listener_info in self._track_state_listeners:
-            try:
-                track, listener_type, cb = listener_info
-                
-                if listener_type == 'mute' and track.mute_has_listener(cb):
-                    track.remove_mute_listener(cb)
-                elif listener_type == 'solo' and track.solo_has_listener(cb):
-                    track.remove_solo_listener(cb)
-                elif listener_type == 'arm' and track.arm_has_listener(cb):
-                    track.remove_arm_listener(cb)
-            except:
-                pass
\ No newline at end of file
+        self._track_listeners.clear()
\ No newline at end of file
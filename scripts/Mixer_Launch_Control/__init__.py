@@ -5,25 +5,69 @@ Grid Mixer and Launch Control Surface
 from __future__ import absolute_import, print_function, unicode_literals
 from _Framework.ControlSurface import ControlSurface
 from _Framework.SessionComponent import SessionComponent
-from _Framework.InputControlElement import MIDI_CC_TYPE
+from _Framework.InputControlElement import MIDI_CC_TYPE, MIDI_NOTE_TYPE
 from _Framework.SliderElement import SliderElement
+from _Framework.ButtonElement import ButtonElement
 
-from .constants import TRIGGER_CC, TRIGGER_CHANNEL, INIT_DELAY
+from .constants import (TRIGGER_CC, TRIGGER_CHANNEL, TRIGGER_FULL_STATE, TRIGGER_STATS_DUMP, TRIGGER_PROFILE_TOGGLE,
+                        INIT_DELAY, USE_RAW_MIDI_INPUT, GROUP_OUTPUT_BY_STATUS, OUTPUT_BUDGET, PROGRESSIVE_REFRESH_TICKS,
+                        GRID_ROWS, GRID_COLS, NUM_TRACKS, RESYNC_PROTOCOL, RESYNC_JOURNAL_SIZE,
+                        SYSEX_MANUFACTURER_ID, SYSEX_RESYNC_REQUEST, SYSEX_CHECKSUM_REPORT,
+                        CHECKSUM_HEALING, CHECKSUM_REGIONS, NATIVE_FADER_FEEDBACK,
+                        TRAFFIC_STATS, TRAFFIC_RATE_WINDOW, LATENCY_PROFILING, PROFILE_CAPTURE,
+                        REGION_CLIP_LEDS, REGION_CLIP_COLORS, REGION_MIX_LEDS, REGION_FADERS,
+                        CAUSE_LISTENER, CAUSE_INPUT, CAUSE_TRIGGER, CAUSE_SETUP)
 from .color_manager import ColorManager
 from .clip_launcher import ClipLauncher
-from .mixer_component import MixerComponent
+from .mixer_component import MixerComponent, MIX_LED_PROPERTIES
 from .navigation_component import NavigationComponent
+from .render_scheduler import RenderScheduler, ProgressiveRefresh
+from .song_snapshot import SongSnapshot
+from .midi_input import MidiDispatcher
+from .midi_output import MidiOutputBuffer, OutputLimiter
+from .traffic_stats import TrafficStats
+from .latency_profiler import LatencyProfiler
+from .profile_capture import ProfileCapture, live_log_directory
+from .resync_journal import ResyncJournal, decode_stamp, version_stamp
+from .feedback_shadow import FeedbackShadow, region_checksum
+
+# Regions whose MIDI Live sends itself - never through _send_midi, so the resync
+# journal, traffic counters, output budget and checksum shadow can't track them
+NATIVE_REGIONS = (REGION_FADERS,) if NATIVE_FADER_FEEDBACK else ()
 
 
 class Grid_mixer_and_launch_control(ControlSurface):
     """Main control surface - 8×4 CLIP GRID"""
     
     def __init__(self, c_instance):
+        # Outgoing MIDI counters (set before the base class - _send_midi counts from the first call)
+        self._render = RenderScheduler()
+        self._refresh = ProgressiveRefresh(self.mark_dirty)  # Full state spread over display ticks
+        self._refresh_notice_pending = False
+        self._journal = ResyncJournal(RESYNC_JOURNAL_SIZE) if RESYNC_PROTOCOL else None  # Versioned change log
+        self._shadow = FeedbackShadow() if CHECKSUM_HEALING else None  # What the controller should show
+        self._traffic = TrafficStats(TRAFFIC_RATE_WINDOW) if TRAFFIC_STATS else None
+        self._latency = LatencyProfiler() if LATENCY_PROFILING else None  # Handlers are wrapped via profiled()
+        self._profile_capture = None
+        if PROFILE_CAPTURE:
+            self._profile_capture = ProfileCapture(live_log_directory(), self._log_profile_status)
+        
+        # Optional status-grouping output stage - flushed after rendering each tick
+        # (set before the base class so _send_midi works from the very first call)
+        self._output = None
+        if GROUP_OUTPUT_BY_STATUS:
+            self._output = MidiOutputBuffer(super(Grid_mixer_and_launch_control, self)._send_midi)
+        
+        # Per-tick output budget in front of it - spills to the following ticks
+        self._limiter = OutputLimiter(self._emit_midi, OUTPUT_BUDGET) if OUTPUT_BUDGET > 0 else None
+        self._midi_map_rebuild_pending = False  # Requested, Live hasn't called build_midi_map yet
+        
         super(Grid_mixer_and_launch_control, self).__init__(c_instance)
         
         self.track_offset = 0
         self.scene_offset = 0  # Scene offset for vertical clip navigation
         self.session = None
+        self.snapshot = SongSnapshot(self)  # Cached tracks/scenes, rebuilt by list listeners
         
         # Components
         self._color_manager = None
@@ -31,6 +75,11 @@ class Grid_mixer_and_launch_control(ControlSurface):
         self._mixer_component = None
         self._navigation = None
         self._trigger_control = None
+        self._tracks_listener = None
+        self._scenes_listener = None
+        
+        # Optional raw input engine - buttons become dispatch table entries
+        self._midi_dispatcher = MidiDispatcher(self) if USE_RAW_MIDI_INPUT else None
         
         with self.component_guard():
             self._setup_session()
@@ -41,14 +90,28 @@ class Grid_mixer_and_launch_control(ControlSurface):
     
     def _delayed_setup(self):
         """Setup all components after initialization"""
+        self.set_cause(CAUSE_SETUP)
         with self.component_guard():
             # Create components
             self._color_manager = ColorManager(self)
             self._clip_launcher = ClipLauncher(self, self._color_manager)
             self._mixer_component = MixerComponent(self)
+            if self._shadow is not None:
+                self._shadow.set_color_cells(self._color_manager.color_cc_cells())
             self._navigation = NavigationComponent(self, self._mixer_component, 
                                                    self._clip_launcher, self._color_manager)
             
+            # Register renderers (flush order: clip states, colors, mixer LEDs, faders)
+            self._render.register(REGION_CLIP_LEDS, self._clip_launcher.update_clip_leds,
+                                  self._clip_launcher.update_clip_led)
+            self._render.register(REGION_CLIP_COLORS,
+                                  lambda: self._color_manager.send_clip_colors(self.track_offset),
+                                  self._color_manager.update_clip_color,
+                                  self._color_manager.flush_color_frame)
+            self._render.register(REGION_MIX_LEDS, self._mixer_component.update_mix_leds,
+                                  self._mixer_component.update_mix_led)
+            self._render.register(REGION_FADERS, self._mixer_component.refresh_fader_feedback)
+            
             # Setup listeners
             self._setup_trigger_listener()
             self._setup_track_list_listener()  # NEW: Watch for track add/delete
@@ -58,47 +121,255 @@ class Grid_mixer_and_launch_control(ControlSurface):
             # Update mixer (works immediately)
             self._mixer_component.update_mix_leds()
         
+        if self._midi_dispatcher is not None:
+            # Forward the dispatch table entries created above
+            self.request_rebuild_midi_map()
+        
+        self.set_cause(CAUSE_LISTENER)
         self.show_message("Grid Mixer & Launch Control ready")
         self.show_message("Navigate: Track L/R (44/45), Scene Up/Down (46/47)")
     
+    def create_button(self, channel, note):
+        """Momentary note button - framework element, or raw table entry with USE_RAW_MIDI_INPUT"""
+        if self._midi_dispatcher is not None:
+            return self._midi_dispatcher.create_control(MIDI_NOTE_TYPE, channel, note)
+        return ButtonElement(True, MIDI_NOTE_TYPE, channel, note)
+    
+    def send_midi(self, midi_bytes):
+        """Raw MIDI from a component - same budget, traffic stats and shadow as framework controls"""
+        return self._send_midi(midi_bytes)
+    
+    def receive_midi(self, midi_bytes):
+        """Forwarded MIDI from Live (profiled while a capture runs)"""
+        if self._profile_capture is not None:
+            self._profile_capture.call(self._receive_midi, midi_bytes)
+        else:
+            self._receive_midi(midi_bytes)
+    
+    def _receive_midi(self, midi_bytes):
+        """Raw dispatch table first, framework elements for everything else"""
+        self.set_cause(CAUSE_INPUT)
+        try:
+            if self._midi_dispatcher is not None and self._midi_dispatcher.receive_midi(midi_bytes):
+                return
+            super(Grid_mixer_and_launch_control, self).receive_midi(midi_bytes)
+        finally:
+            self.set_cause(CAUSE_LISTENER)
+    
+    def handle_sysex(self, midi_bytes):
+        """Resync request (F0 7D 03 ...) or checksum report (F0 7D 04 ...) from the controller"""
+        if len(midi_bytes) < 4 or midi_bytes[1] != SYSEX_MANUFACTURER_ID:
+            return
+        command = midi_bytes[2]
+        if command == SYSEX_RESYNC_REQUEST and self._journal is not None:
+            self._resync(*decode_stamp(midi_bytes[3:-1]))
+        elif command == SYSEX_CHECKSUM_REPORT and self._shadow is not None:
+            self._check_regions(midi_bytes[3:-1])
+    
+    def _check_regions(self, payload):
+        """Resend only the regions whose reported checksum differs from what was sent"""
+        if self._color_manager is None:
+            return
+        
+        self.set_cause(CAUSE_TRIGGER)
+        for start in range(0, len(payload) - 2, 3):
+            region_id = payload[start]
+            if region_id >= len(CHECKSUM_REGIONS):
+                continue
+            region = CHECKSUM_REGIONS[region_id]
+            reported = (payload[start + 1] << 7) | payload[start + 2]
+            if region in NATIVE_REGIONS:
+                # Not in the shadow - expected values come from the parameters, same tables as the Python path
+                expected = region_checksum(self._mixer_component.fader_feedback_values())
+            else:
+                expected = self._shadow.checksum(region)
+            if reported == expected:
+                continue
+            
+            self.log_message("Checksum mismatch in %s - resending" % region)
+            if region == REGION_CLIP_LEDS:
+                self._clip_launcher.invalidate_clip_leds()
+            elif region == REGION_CLIP_COLORS:
+                self._color_manager.invalidate_clip_colors()
+            self.mark_dirty(region)
+    
+    def _resync(self, epoch, wire_version):
+        """
+        Send the cells changed since the controller's version - full state if the
+        journal rolled over or the version is from another script instance
+        """
+        if self._color_manager is None:
+            return  # Not set up yet - the first tick after setup sends everything anyway
+        
+        self.set_cause(CAUSE_TRIGGER)
+        version = self._journal.expand(wire_version)
+        changes = self._journal.changes_since(epoch, version)
+        if changes is None:
+            self.log_message("Resync: version %d of epoch %d is not in the journal - sending full state"
+                             % (version, epoch))
+            self._send_full_state()
+            return
+        
+        for region in NATIVE_REGIONS:
+            self.mark_dirty(region)  # Not journaled - whatever the controller missed, Live resends
+        if not changes:
+            self._send_midi(version_stamp(self._journal.epoch, self._journal.version))  # Already current
+        else:
+            # Shadow caches may hold values the controller never got
+            self._color_manager.invalidate_clip_colors()
+            self._clip_launcher.invalidate_clip_leds()
+            for region, cell in changes:
+                self.mark_dirty(region, cell)
+    
+    def request_rebuild_midi_map(self):
+        self._midi_map_rebuild_pending = True
+        super(Grid_mixer_and_launch_control, self).request_rebuild_midi_map()
+    
+    def request_fader_feedback(self):
+        """
+        Native fader feedback: have Live resend every mapped fader value. The
+        framework's _install_mapping calls Live.MidiMap.send_feedback_for_parameter
+        for each mapping it installs, so one map rebuild does it - none is
+        requested if one is already on its way (navigation, setup)
+        """
+        if not self._midi_map_rebuild_pending:
+            self.request_rebuild_midi_map()
+    
+    def build_midi_map(self, midi_map_handle):
+        self._midi_map_rebuild_pending = False
+        super(Grid_mixer_and_launch_control, self).build_midi_map(midi_map_handle)
+        if self._midi_dispatcher is not None:
+            self._midi_dispatcher.build_midi_map(midi_map_handle)
+    
+    def mark_dirty(self, region, cell=None):
+        """Queue a region (or one (row, col) cell of it) for the next display tick"""
+        self._render.mark_dirty(region, cell)
+        if region in NATIVE_REGIONS:
+            return  # Rendered by asking Live - no MIDI of ours to attribute or journal
+        if self._traffic is not None:
+            self._traffic.mark_region(region)
+        if self._journal is not None:
+            self._journal.record(region, cell)
+    
+    def record_sent(self, region, cell=None):
+        """Journal output a component sent without the render scheduler - a resync replays it"""
+        if self._journal is not None:
+            self._journal.record(region, cell)
+    
+    def profiled(self, name, callback):
+        """
+        Callback timed into the named latency histogram (LATENCY_PROFILING) and/or
+        routed through the profile capture (PROFILE_CAPTURE) - returned unchanged
+        when both are off. Components wrap their listener and button handlers with it
+        """
+        if self._latency is not None:
+            callback = self._latency.wrap(name, callback)
+        if self._profile_capture is not None:
+            callback = self._profile_capture.wrap(callback)
+        return callback
+    
+    def set_cause(self, cause):
+        """Tag the MIDI produced from here on (and regions dirtied) with a traffic cause"""
+        if self._traffic is not None:
+            self._traffic.cause = cause
+    
+    def update_display(self):
+        """Called by Live every tick - flush coalesced MIDI feedback"""
+        if self._profile_capture is not None:
+            self._profile_capture.call(self._update_display)
+        else:
+            self._update_display()
+    
+    def _update_display(self):
+        """One display tick - framework update, then the coalesced feedback"""
+        super(Grid_mixer_and_launch_control, self).update_display()
+        if self._refresh.running:
+            self.set_cause(CAUSE_TRIGGER)
+            if self._refresh.step():
+                self._refresh_notice_pending = True
+            self.set_cause(CAUSE_LISTENER)
+        if self._mixer_component:
+            self._mixer_component.flush_fader_feedback()  # Throttled fader values (Python fader feedback)
+        
+        # Everything marked so far renders this tick and belongs to the new version
+        version = self._journal.commit() if self._journal is not None else None
+        self._render.flush()
+        if version is not None:
+            # Queued behind this tick's feedback - stamps what has been sent
+            self._send_midi(version_stamp(self._journal.epoch, version))
+        if self._limiter is not None:
+            self._limiter.flush()
+        if self._output is not None:
+            self._output.flush()
+        if self._refresh_notice_pending and (self._limiter is None or not self._limiter.pending()):
+            # Everything of the refresh has left the output queue
+            self._refresh_notice_pending = False
+            self.show_message("Full state sent")
+        if self._traffic is not None:
+            self._traffic.tick()
+    
+    def _send_midi(self, midi_event_bytes, optimized=True):
+        """All outgoing MIDI - queued behind the output budget when enabled, with its traffic cause"""
+        cause = self._traffic.cause_for(self._render.current_region) if self._traffic is not None else None
+        if self._limiter is not None:
+            self._limiter.add(midi_event_bytes, cause)
+            return True
+        return self._emit_midi(midi_event_bytes, cause, optimized)
+    
+    def _emit_midi(self, midi_event_bytes, cause=None, optimized=True):
+        """Send now - counted (values the budget replaced never get here), buffered for status ordering"""
+        if self._traffic is not None:
+            self._traffic.count(midi_event_bytes, cause)
+        if self._shadow is not None:
+            self._shadow.record(midi_event_bytes)
+        if self._output is not None and self._output.add(midi_event_bytes):
+            return True
+        return super(Grid_mixer_and_launch_control, self)._send_midi(midi_event_bytes, optimized)
+    
     def _setup_track_list_listener(self):
         """Listen for track add/remove/duplicate"""
         song = self.song()
-        if not song.tracks_has_listener(self._on_tracks_changed):
-            song.add_tracks_listener(self._on_tracks_changed)
+        if self._tracks_listener is None:
+            self._tracks_listener = self.profiled('listener.tracks', self._on_tracks_changed)
+        if not song.tracks_has_listener(self._tracks_listener):
+            song.add_tracks_listener(self._tracks_listener)
         
         # Also listen for scene changes
-        if not song.scenes_has_listener(self._on_scenes_changed):
-            song.add_scenes_listener(self._on_scenes_changed)
+        if self._scenes_listener is None:
+            self._scenes_listener = self.profiled('listener.scenes', self._on_scenes_changed)
+        if not song.scenes_has_listener(self._scenes_listener):
+            song.add_scenes_listener(self._scenes_listener)
     
     def _on_tracks_changed(self):
         """Called when tracks are added, deleted, or duplicated"""
         self.log_message("Track list changed - rebuilding listeners")
+        self.snapshot.invalidate()
         
         # Adjust track offset if needed (in case tracks were deleted)
-        num_tracks = len(self.song().tracks)
+        num_tracks = len(self.snapshot.tracks)
         if self.track_offset > max(0, num_tracks - 8):
             self.track_offset = max(0, num_tracks - 8)
         
         # Update session highlighting
         self.session.set_offsets(self.track_offset, self.scene_offset)
         
-        # Rebuild all listeners
+        # Rebuild all listeners (mixer listeners follow the offset)
         self._clip_launcher.setup_clip_listeners()
-        self._mixer_component.setup_track_listeners()
+        self._mixer_component.set_track_offset(self.track_offset)
+        self.log_message("Track listeners registered: %d" % self._mixer_component.listener_count())
         
         # Update MIDI feedback
-        self._mixer_component.set_track_offset(self.track_offset)
-        self._mixer_component.update_mix_leds()
-        self._color_manager.send_clip_colors(self.track_offset)
-        self._clip_launcher.update_clip_leds()
+        self.mark_dirty(REGION_MIX_LEDS)
+        self.mark_dirty(REGION_CLIP_COLORS)
+        self.mark_dirty(REGION_CLIP_LEDS)
     
     def _on_scenes_changed(self):
         """Called when scenes are added or deleted"""
         self.log_message("Scene list changed - rebuilding clip listeners")
+        self.snapshot.invalidate()
         
         # Adjust scene offset if needed (in case scenes were deleted)
-        num_scenes = len(self.song().scenes)
+        num_scenes = len(self.snapshot.scenes)
         if self.scene_offset > max(0, num_scenes - 4):
             self.scene_offset = max(0, num_scenes - 4)
         
@@ -109,8 +380,8 @@ class Grid_mixer_and_launch_control(ControlSurface):
         self._clip_launcher.setup_clip_listeners()
         
         # Update clip MIDI feedback
-        self._color_manager.send_clip_colors(self.track_offset)
-        self._clip_launcher.update_clip_leds()
+        self.mark_dirty(REGION_CLIP_COLORS)
+        self.mark_dirty(REGION_CLIP_LEDS)
     
     def _setup_session(self):
         """Setup session component for highlighting - 8×4 grid"""
@@ -127,29 +398,85 @@ class Grid_mixer_and_launch_control(ControlSurface):
     
     def _setup_trigger_listener(self):
         """Setup trigger CC for full state refresh"""
-        self._trigger_control = SliderElement(MIDI_CC_TYPE, TRIGGER_CHANNEL, TRIGGER_CC)
-        self._trigger_control.add_value_listener(self._trigger_handler, True)
+        if self._midi_dispatcher is not None:
+            self._trigger_control = self._midi_dispatcher.create_control(MIDI_CC_TYPE, TRIGGER_CHANNEL, TRIGGER_CC)
+        else:
+            self._trigger_control = SliderElement(MIDI_CC_TYPE, TRIGGER_CHANNEL, TRIGGER_CC)
+        self._trigger_control.add_value_listener(self.profiled('trigger', self._trigger_handler), True)
     
     def _trigger_handler(self, value, sender=None):
-        """Handle trigger CC to send full state"""
-        if value == 127:
+        """Handle trigger CC - full state refresh or stats dump"""
+        if value == TRIGGER_FULL_STATE:
+            self.set_cause(CAUSE_TRIGGER)
             self._send_full_state()
-            self.show_message("Full state sent")
+        elif value == TRIGGER_STATS_DUMP:
+            self._log_stats()
+        elif value == TRIGGER_PROFILE_TOGGLE:
+            self._toggle_profile_capture()
+    
+    def _toggle_profile_capture(self):
+        """Start or stop the cProfile capture"""
+        if self._profile_capture is None:
+            self.show_message("Profile capture disabled (PROFILE_CAPTURE)")
+        elif self._profile_capture.active:
+            self._profile_capture.stop()
+            self.show_message("Profile capture stopped")
+        else:
+            self._profile_capture.start()
+            self.show_message("Profile capture started")
+    
+    def _log_profile_status(self, message):
+        self.log_message(message)
+        self.show_message(message)
+    
+    def _log_stats(self):
+        """Write the MIDI traffic counters and handler latency histograms to Live's log"""
+        if self._latency is not None:
+            for line in self._latency.report():
+                self.log_message(line)
+        if self._traffic is None:
+            self.show_message("Traffic stats disabled (TRAFFIC_STATS)")
+            return
+        for line in self._traffic.report():
+            self.log_message(line)
+        if NATIVE_REGIONS:
+            self.log_message("  Not counted: %s (sent by Live's MIDI map)" % ", ".join(NATIVE_REGIONS))
+        self.show_message("MIDI traffic: %.1f msgs/s, peak %.1f - see Log.txt"
+                          % (self._traffic.rate(), self._traffic.peak_rate))
     
     def _send_full_state(self):
-        """Send complete state to controller"""
-        self._mixer_component.send_full_state()
-        self._color_manager.send_clip_colors(self.track_offset)
-        self._clip_launcher.update_clip_leds()
+        """Send complete state to controller (rendered over PROGRESSIVE_REFRESH_TICKS ticks)"""
+        self._color_manager.invalidate_clip_colors()
+        self._clip_launcher.invalidate_clip_leds()
+        self._refresh_notice_pending = False
+        self._refresh.start(self._full_state_steps(), PROGRESSIVE_REFRESH_TICKS)
+    
+    def _full_state_steps(self):
+        """Render steps of a full refresh - visible clip states, mixer, then colors"""
+        clip_cells = [(row, col) for row in range(GRID_ROWS) for col in range(GRID_COLS)]
+        steps = [(REGION_CLIP_LEDS, cell) for cell in clip_cells]
+        steps += [(REGION_MIX_LEDS, (row, strip))
+                  for strip in range(NUM_TRACKS) for row in range(len(MIX_LED_PROPERTIES))]
+        steps.append((REGION_FADERS, None))
+        steps += [(REGION_CLIP_COLORS, cell) for cell in clip_cells]
+        return steps
     
     def disconnect(self):
         """Cleanup on disconnect"""
         # Remove track/scene list listeners
         song = self.song()
-        if song.tracks_has_listener(self._on_tracks_changed):
-            song.remove_tracks_listener(self._on_tracks_changed)
-        if song.scenes_has_listener(self._on_scenes_changed):
-            song.remove_scenes_listener(self._on_scenes_changed)
+        if self._tracks_listener is not None and song.tracks_has_listener(self._tracks_listener):
+            song.remove_tracks_listener(self._tracks_listener)
+        if self._scenes_listener is not None and song.scenes_has_listener(self._scenes_listener):
+            song.remove_scenes_listener(self._scenes_listener)
+        
+        # Drop pending feedback
+        self._render.clear()
+        self._refresh.cancel()
+        if self._limiter is not None:
+            self._limiter.clear()
+        if self._output is not None:
+            self._output.clear()
         
         # Cleanup components
         if self._clip_launcher:
@@ -1,10 +1,14 @@
 """
 Grid Mixer and Launch Control - Clip Launcher Component
-SIMPLE VERSION - Batch updates only
+Per-slot listeners - only the affected cell is updated
 """
-from _Framework.InputControlElement import MIDI_NOTE_TYPE
-from _Framework.ButtonElement import ButtonElement
-from .constants import CLIP_NOTE_START, CLIP_LAUNCH_CHANNEL, GRID_ROWS, GRID_COLS, LED_OFF, LED_STOPPED, LED_RECORDING, LED_PLAYING
+from collections import OrderedDict
+from .constants import (CLIP_NOTE_START, CLIP_LAUNCH_CHANNEL, GRID_ROWS, GRID_COLS, LED_OFF, LED_STOPPED, LED_RECORDING, LED_PLAYING,
+                        REGION_CLIP_LEDS, REGION_CLIP_COLORS,
+                        LOOKAHEAD_TRACKS, LOOKAHEAD_SCENES, LOOKAHEAD_MAX_COLUMNS)
+
+# Bound slots keep computed LED/RGB state only with look-ahead - otherwise every read goes to Live
+STATE_CACHE = bool(LOOKAHEAD_TRACKS or LOOKAHEAD_SCENES)
 
 
 class ClipLauncher:
@@ -14,7 +18,12 @@ class ClipLauncher:
         self._parent = parent
         self._color_manager = color_manager
         self._clip_buttons = []
-        self._clip_slot_listeners = []
+        self._slot_listeners = {}  # (track, scene) -> has_clip listener of a bound slot
+        self._clip_listeners = {}  # (track, scene) -> playing/color listeners of the slot's clip
+        self._led_state = {}  # (track, scene) -> LED value of a bound slot (STATE_CACHE only)
+        self._column_lru = OrderedDict()  # Bound track columns, least recently shown first
+        self._listener_churn = 0  # Listeners attached + detached, for benchmarks
+        self._led_cache = [None] * (GRID_ROWS * GRID_COLS)  # Last LED value sent per cell
         self._setup_clip_buttons()
     
     def _setup_clip_buttons(self):
@@ -31,7 +40,7 @@ class ClipLauncher:
                     note = 76 + row * 4 + (col - 4)
                 
                 # IMPORTANT: Clip launch buttons on Channel 5 (MIDI channel 5)
-                btn = ButtonElement(True, MIDI_NOTE_TYPE, CLIP_LAUNCH_CHANNEL, note)
+                btn = self._parent.create_button(CLIP_LAUNCH_CHANNEL, note)
                 
                 def make_launch_handler(scene_idx, track_col):
                     def handler(value):
@@ -39,7 +48,7 @@ class ClipLauncher:
                             self._launch_clip(scene_idx, track_col)
                     return handler
                 
-                btn.add_value_listener(make_launch_handler(row, col))
+                btn.add_value_listener(self._parent.profiled('button.clip_launch', make_launch_handler(row, col)))
                 self._clip_buttons.append(btn)
     
     def _launch_clip(self, scene_idx, track_col):
@@ -49,15 +58,18 @@ class ClipLauncher:
         track_idx = track_offset + track_col
         scene_idx_abs = scene_offset + scene_idx  # Absolute scene position
         
-        if track_idx < len(self._parent.song().tracks):
-            track = self._parent.song().tracks[track_idx]
-            if scene_idx_abs < len(track.clip_slots):
-                clip_slot = track.clip_slots[scene_idx_abs]
-                clip_slot.fire()
+        clip_slot = self._parent.snapshot.clip_slot(track_idx, scene_idx_abs)
+        if clip_slot is not None:
+            clip_slot.fire()
+    
+    def invalidate_clip_leds(self):
+        """Forget last sent LED values so the next update resends every cell - re-read from Live"""
+        self._led_cache = [None] * (GRID_ROWS * GRID_COLS)
+        for key in self._led_state:
+            self._led_state[key] = self._compute_led_value(self._slot_listeners[key][1])
     
     def update_clip_leds(self):
-        """Update ALL clip LEDs - uses scene_offset for vertical position"""
-        tracks = self._parent.song().tracks
+        """Update clip LEDs that changed since last send - uses scene_offset for vertical position"""
         track_offset = self._parent.track_offset
         scene_offset = self._parent.scene_offset
         
@@ -65,120 +77,239 @@ class ClipLauncher:
             track_idx = track_offset + col
             
             for row in range(GRID_ROWS):
-                button_idx = row * GRID_COLS + col
                 scene_idx = scene_offset + row  # Absolute scene position
+                self._send_clip_led(row, col, self._get_led_value(track_idx, scene_idx))
+    
+    def update_clip_led(self, row, col):
+        """Update a single clip LED (used by per-slot listeners)"""
+        track_idx = self._parent.track_offset + col
+        scene_idx = self._parent.scene_offset + row
+        self._send_clip_led(row, col, self._get_led_value(track_idx, scene_idx))
+    
+    def _get_led_value(self, track_idx, scene_idx):
+        """Return the LED value for the clip at track/scene - bound slots come from the state cache"""
+        led_value = self._led_state.get((track_idx, scene_idx))
+        if led_value is not None:
+            return led_value
+        return self._compute_led_value(self._parent.snapshot.clip_slot(track_idx, scene_idx))
+    
+    def _compute_led_value(self, clip_slot):
+        """Read the LED value for a clip slot from Live"""
+        if clip_slot is not None and clip_slot.has_clip:
+            clip = clip_slot.clip
+            
+            try:
+                is_rec = False
+                if hasattr(clip, 'is_recording'):
+                    is_rec = clip.is_recording
                 
-                if button_idx >= len(self._clip_buttons):
-                    continue
-                    
-                button = self._clip_buttons[button_idx]
-                led_value = LED_OFF
-                
-                if track_idx < len(tracks):
-                    track = tracks[track_idx]
-                    
-                    if scene_idx < len(track.clip_slots):
-                        clip_slot = track.clip_slots[scene_idx]
-                        
-                        if clip_slot.has_clip:
-                            clip = clip_slot.clip
-                            
-                            try:
-                                is_rec = False
-                                if hasattr(clip, 'is_recording'):
-                                    is_rec = clip.is_recording
-                                
-                                is_play = clip.is_playing
-                                
-                                if is_rec:
-                                    led_value = LED_RECORDING
-                                elif is_play:
-                                    led_value = LED_PLAYING
-                                else:
-                                    led_value = LED_STOPPED
-                            except:
-                                led_value = LED_STOPPED
+                is_play = clip.is_playing
                 
-                button.send_value(led_value, True)
+                if is_rec:
+                    return LED_RECORDING
+                elif is_play:
+                    return LED_PLAYING
+                else:
+                    return LED_STOPPED
+            except:
+                return LED_STOPPED
+        
+        return LED_OFF
+    
+    def _send_clip_led(self, row, col, led_value):
+        """Send LED value for one cell if it differs from what the controller shows"""
+        button_idx = row * GRID_COLS + col
+        if button_idx >= len(self._clip_buttons):
+            return
+        
+        if self._led_cache[button_idx] != led_value:
+            self._led_cache[button_idx] = led_value
+            self._clip_buttons[button_idx].send_value(led_value, True)
     
     def setup_clip_listeners(self):
-        """Setup listeners - uses scene_offset for vertical position"""
+        """Rebind every listener in the window - used when the track/scene list changes"""
         self._remove_clip_listeners()
+        self.update_clip_window()
+    
+    def update_clip_window(self):
+        """
+        Incremental rebind after navigation - only slots entering the window get
+        listeners, only slots leaving it lose them. Listeners are keyed by absolute
+        (track, scene) so the ones shared by old and new window stay attached.
         
-        tracks = self._parent.song().tracks
+        With LOOKAHEAD_TRACKS/SCENES the bound area extends past the box; columns
+        that scrolled out stay cached until LOOKAHEAD_MAX_COLUMNS is exceeded.
+        """
+        snapshot = self._parent.snapshot
         track_offset = self._parent.track_offset
         scene_offset = self._parent.scene_offset
         
-        for col in range(GRID_COLS):
-            track_idx = track_offset + col
-            
-            if track_idx >= len(tracks):
-                continue
-                
-            track = tracks[track_idx]
+        first_track = max(0, track_offset - LOOKAHEAD_TRACKS)
+        first_scene = max(0, scene_offset - LOOKAHEAD_SCENES)
+        last_scene = scene_offset + GRID_ROWS + LOOKAHEAD_SCENES
+        
+        wanted = {}
+        for track_idx in range(first_track, track_offset + GRID_COLS + LOOKAHEAD_TRACKS):
+            for scene_idx in range(first_scene, last_scene):
+                clip_slot = snapshot.clip_slot(track_idx, scene_idx)
+                if clip_slot is not None:
+                    wanted[(track_idx, scene_idx)] = clip_slot
+        
+        # Columns in the bound area become most recently used
+        wanted_columns = set(key[0] for key in wanted)
+        for track_idx in sorted(wanted_columns):
+            self._column_lru.pop(track_idx, None)
+            self._column_lru[track_idx] = True
+        
+        evicted = self._evict_columns(wanted_columns)
+        
+        for key in [k for k in self._slot_listeners if k not in wanted]:
+            # Cached columns keep their slots unless they fell outside the scene range
+            if not LOOKAHEAD_TRACKS or key[0] in evicted or not first_scene <= key[1] < last_scene:
+                self._remove_slot_listeners(key)
+        
+        for key, clip_slot in wanted.items():
+            if key not in self._slot_listeners:
+                self._add_slot_listeners(key, clip_slot)
+    
+    def _evict_columns(self, wanted_columns):
+        """Drop least recently shown columns beyond the cap - returns the evicted track indices"""
+        limit = max(LOOKAHEAD_MAX_COLUMNS, len(wanted_columns)) if LOOKAHEAD_TRACKS else len(wanted_columns)
+        evicted = set()
+        
+        for track_idx in list(self._column_lru):
+            if len(self._column_lru) <= limit:
+                break
+            if track_idx not in wanted_columns:
+                del self._column_lru[track_idx]
+                evicted.add(track_idx)
+        
+        return evicted
+    
+    def listener_churn(self):
+        """Total listeners attached + detached so far (for benchmarks)"""
+        return self._listener_churn
+    
+    def _mark_slot_dirty(self, region, key):
+        """Mark the cell showing absolute (track, scene) dirty, if it is on screen"""
+        track_idx, scene_idx = key
+        col = track_idx - self._parent.track_offset
+        row = scene_idx - self._parent.scene_offset
+        if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
+            self._parent.mark_dirty(region, (row, col))
+    
+    def _add_slot_listeners(self, key, clip_slot):
+        """Attach has_clip listener to a slot plus playing/color listeners to its clip"""
+        # Has clip listener - rebinds only this slot
+        def make_has_clip_callback(k, slot):
+            def callback():
+                self._on_has_clip_changed(k, slot)
+            return self._parent.profiled('listener.has_clip', callback)
+        
+        has_clip_cb = make_has_clip_callback(key, clip_slot)
+        if not clip_slot.has_clip_has_listener(has_clip_cb):
+            clip_slot.add_has_clip_listener(has_clip_cb)
+            self._slot_listeners[key] = ('has_clip', clip_slot, has_clip_cb)
+            self._listener_churn += 1
+        
+        self._cache_slot_state(key, clip_slot)
+        
+        if clip_slot.has_clip:
+            self._add_clip_listeners(key, clip_slot)
+    
+    def _add_clip_listeners(self, key, clip_slot):
+        """Attach playing status and color listeners for the clip at absolute (track, scene)"""
+        listeners = []
+        clip = clip_slot.clip
+        
+        # Playing status listener - only the affected LED is resent (next tick)
+        def make_playing_callback(k, slot):
+            def callback():
+                if STATE_CACHE:
+                    self._led_state[k] = self._compute_led_value(slot)
+                self._mark_slot_dirty(REGION_CLIP_LEDS, k)
+            return self._parent.profiled('listener.playing_status', callback)
+        
+        playing_cb = make_playing_callback(key, clip_slot)
+        if not clip.playing_status_has_listener(playing_cb):
+            clip.add_playing_status_listener(playing_cb)
+            listeners.append(('playing', clip, playing_cb))
+        
+        # Color listener - only the affected cell is resent (next tick)
+        def make_color_callback(k, slot):
+            def callback():
+                if STATE_CACHE:
+                    self._color_manager.cache_clip_color(k, slot)
+                self._mark_slot_dirty(REGION_CLIP_COLORS, k)
+            return self._parent.profiled('listener.clip_color', callback)
+        
+        color_cb = make_color_callback(key, clip_slot)
+        if not clip.color_has_listener(color_cb):
+            clip.add_color_listener(color_cb)
+            listeners.append(('color', clip, color_cb))
+        
+        self._clip_listeners[key] = listeners
+        self._listener_churn += len(listeners)
+    
+    def _on_has_clip_changed(self, key, clip_slot):
+        """Clip added/removed in a visible slot - rebind and refresh just that cell"""
+        for listener_info in self._clip_listeners.pop(key, []):
+            self._remove_listener(listener_info)
+        
+        if clip_slot.has_clip:
+            self._add_clip_listeners(key, clip_slot)
+        
+        self._cache_slot_state(key, clip_slot)
+        self._mark_slot_dirty(REGION_CLIP_COLORS, key)
+        self._mark_slot_dirty(REGION_CLIP_LEDS, key)
+    
+    def _cache_slot_state(self, key, clip_slot):
+        """Look-ahead: keep the slot's state while listeners keep it current, so scrolling onto it is a cache read"""
+        if STATE_CACHE:
+            self._led_state[key] = self._compute_led_value(clip_slot)
+            self._color_manager.cache_clip_color(key, clip_slot)
+    
+    def _remove_listener(self, listener_info):
+        """Remove a single (type, obj, callback) listener"""
+        self._listener_churn += 1
+        try:
+            listener_type, obj, cb = listener_info
             
-            for row in range(GRID_ROWS):
-                scene_idx = scene_offset + row  # Absolute scene position
-                
-                if scene_idx >= len(track.clip_slots):
-                    continue
-                    
-                clip_slot = track.clip_slots[scene_idx]
-                
-                # Has clip listener
-                def make_has_clip_callback():
-                    def callback():
-                        self.setup_clip_listeners()
-                        self._color_manager.send_clip_colors(self._parent.track_offset)
-                        self.update_clip_leds()
-                    return callback
-                
-                has_clip_cb = make_has_clip_callback()
-                if not clip_slot.has_clip_has_listener(has_clip_cb):
-                    clip_slot.add_has_clip_listener(has_clip_cb)
-                    self._clip_slot_listeners.append(('has_clip', clip_slot, has_clip_cb))
-                
-                if clip_slot.has_clip:
-                    clip = clip_slot.clip
-                    
-                    # Playing status listener
-                    def make_playing_callback():
-                        return lambda: self.update_clip_leds()
-                    
-                    playing_cb = make_playing_callback()
-                    if not clip.playing_status_has_listener(playing_cb):
-                        clip.add_playing_status_listener(playing_cb)
-                        self._clip_slot_listeners.append(('playing', clip, playing_cb))
-                    
-                    # Color listener
-                    def make_color_callback():
-                        return lambda: self._color_manager.send_clip_colors(self._parent.track_offset)
-                    
-                    color_cb = make_color_callback()
-                    if not clip.color_has_listener(color_cb):
-                        clip.add_color_listener(color_cb)
-                        self._clip_slot_listeners.append(('color', clip, color_cb))
+            if listener_type == 'has_clip':
+                if obj.has_clip_has_listener(cb):
+                    obj.remove_has_clip_listener(cb)
+            elif listener_type == 'playing':
+                if obj.playing_status_has_listener(cb):
+                    obj.remove_playing_status_listener(cb)
+            elif listener_type == 'color':
+                if obj.color_has_listener(cb):
+                    obj.remove_color_listener(cb)
+        except:
+            pass
+    
+    def _remove_slot_listeners(self, key):
+        """Detach everything attached for one absolute (track, scene) slot"""
+        listener_info = self._slot_listeners.pop(key, None)
+        if listener_info is not None:
+            self._remove_listener(listener_info)
+        
+        for listener_info in self._clip_listeners.pop(key, []):
+            self._remove_listener(listener_info)
+        
+        self._led_state.pop(key, None)
+        self._color_manager.forget_clip_color(key)
     
     def _remove_clip_listeners(self):
-        """Remove all clip listeners"""
-        for listener_info in self._clip_slot_listeners:
-            try:
-                listener_type, obj, cb = listener_info
-                
-                if listener_type == 'has_clip':
-                    if obj.has_clip_has_listener(cb):
-                        obj.remove_has_clip_listener(cb)
-                elif listener_type == 'playing':
-                    if obj.playing_status_has_listener(cb):
-                        obj.remove_playing_status_listener(cb)
-                elif listener_type == 'color':
-                    if obj.color_has_listener(cb):
-                        obj.remove_color_listener(cb)
-            except:
-                pass
+        """Remove all clip listeners and cached slot state"""
+        for key in list(self._slot_listeners):
+            self._remove_slot_listeners(key)
         
-        self._clip_slot_listeners = []
+        self._slot_listeners = {}
+        self._clip_listeners = {}
+        self._led_state = {}
+        self._column_lru = OrderedDict()
+        self._color_manager.clear_color_state()
     
     def disconnect(self):
         """Cleanup on disconnect"""
-        self._remove_clip_listeners()
\ No newline at end of file
+        self._remove_clip_listeners()
@@ -1,10 +1,9 @@
 """
 Grid Mixer and Launch Control - Color Manager Component
-SIMPLE VERSION - Batch updates only
+Cached per-cell colors - only changed channels (CC) or changed cells (SysEx) are sent
 """
-from _Framework.InputControlElement import MIDI_CC_TYPE
-from _Framework.SliderElement import SliderElement
-from .constants import RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL, COLOR_CC_START, GRID_ROWS, GRID_COLS
+from .constants import (CC_STATUS, RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL, COLOR_CC_START, GRID_ROWS, GRID_COLS,
+                        COLOR_MODE, COLOR_MODE_SYSEX, SYSEX_COLOR_HEADER, SYSEX_COLOR_CELLS_PER_MESSAGE)
 
 
 class ColorManager:
@@ -12,14 +11,15 @@ class ColorManager:
     
     def __init__(self, parent):
         self._parent = parent
-        self._color_controls_r = []
-        self._color_controls_g = []
-        self._color_controls_b = []
+        self._color_ccs = []  # CC number per cell - colors are output only, sent as raw MIDI
+        self._color_cache = [None] * (GRID_ROWS * GRID_COLS)  # Last (r, g, b) sent per cell
+        self._frame_cells = []  # SysEx mode: (cell, rgb) waiting for flush_color_frame
+        self._rgb_state = {}  # (track, scene) -> (slot, (r, g, b)) of bound slots (look-ahead only)
         self._setup_color_controls()
     
     def _setup_color_controls(self):
         """
-        RGB colors on 3 channels - 2 separate 4×4 modules:
+        RGB color CC numbers on 3 channels - 2 separate 4×4 modules:
         Module 1: CC 60-75 (4×4 = 16 CCs)
         Module 2: CC 76-91 (4×4 = 16 CCs)
         """
@@ -34,26 +34,25 @@ class ColorManager:
                     # Module 2: 4×4 grid starting at CC 76
                     cc_num = 76 + row * 4 + (col - 4)
                 
-                # Red channel
-                red_control = SliderElement(MIDI_CC_TYPE, RED_CHANNEL, cc_num)
-                self._color_controls_r.append(red_control)
-                
-                # Green channel
-                green_control = SliderElement(MIDI_CC_TYPE, GREEN_CHANNEL, cc_num)
-                self._color_controls_g.append(green_control)
-                
-                # Blue channel
-                blue_control = SliderElement(MIDI_CC_TYPE, BLUE_CHANNEL, cc_num)
-                self._color_controls_b.append(blue_control)
+                self._color_ccs.append(cc_num)
+    
+    def color_cc_cells(self):
+        """Color CC number -> grid cell (row * GRID_COLS + col)"""
+        return dict((cc_num, control_idx) for control_idx, cc_num in enumerate(self._color_ccs))
+    
+    def invalidate_clip_colors(self):
+        """Forget last sent colors so the next update resends every channel - re-read from Live"""
+        self._color_cache = [None] * (GRID_ROWS * GRID_COLS)
+        for key, (clip_slot, _) in list(self._rgb_state.items()):
+            self._rgb_state[key] = (clip_slot, self._compute_clip_rgb(clip_slot))
     
     def send_clip_colors(self, track_offset):
         """
-        Send RGB colors for ALL visible clips - uses scene_offset for vertical position
+        Send RGB colors for visible clips that changed - uses scene_offset for vertical position
         Ch2 (176): Red
         Ch3 (177): Green
         Ch4 (178): Blue
         """
-        tracks = self._parent.song().tracks
         scene_offset = self._parent.scene_offset  # ✅ USE SCENE OFFSET!
         
         for col in range(GRID_COLS):
@@ -63,35 +62,95 @@ class ColorManager:
                 control_idx = row * GRID_COLS + col
                 scene_idx = scene_offset + row  # ✅ ABSOLUTE SCENE INDEX!
                 
-                if control_idx >= len(self._color_controls_r):
+                if control_idx >= len(self._color_ccs):
                     continue
                 
-                r_value = 0
-                g_value = 0
-                b_value = 0
-                
-                if track_idx < len(tracks):
-                    track = tracks[track_idx]
-                    
-                    if scene_idx < len(track.clip_slots):  # ✅ USE scene_idx!
-                        clip_slot = track.clip_slots[scene_idx]
-                        
-                        if clip_slot.has_clip:
-                            clip = clip_slot.clip
-                            
-                            try:
-                                # Raw RGB color value
-                                rgb_color = int(clip.color)
-                                
-                                # Extract R, G, B channels via bit shifting
-                                r_value = (rgb_color >> 16) & 0xFF
-                                g_value = (rgb_color >> 8) & 0xFF
-                                b_value = rgb_color & 0xFF
-                                
-                            except:
-                                pass
+                self._send_cell_color(control_idx, self._get_clip_rgb(track_idx, scene_idx))
+        
+        self.flush_color_frame()
+    
+    def update_clip_color(self, row, col):
+        """Send the color of a single grid cell (SysEx mode: queued until flush_color_frame)"""
+        control_idx = row * GRID_COLS + col
+        if control_idx >= len(self._color_ccs):
+            return
+        
+        track_idx = self._parent.track_offset + col
+        scene_idx = self._parent.scene_offset + row
+        self._send_cell_color(control_idx, self._get_clip_rgb(track_idx, scene_idx))
+    
+    def cache_clip_color(self, key, clip_slot):
+        """Store the current color of a bound (track, scene) slot"""
+        self._rgb_state[key] = (clip_slot, self._compute_clip_rgb(clip_slot))
+    
+    def forget_clip_color(self, key):
+        self._rgb_state.pop(key, None)
+    
+    def clear_color_state(self):
+        self._rgb_state = {}
+    
+    def _get_clip_rgb(self, track_idx, scene_idx):
+        """Return (r, g, b) of the clip at track/scene - bound slots come from the state cache"""
+        state = self._rgb_state.get((track_idx, scene_idx))
+        if state is not None:
+            return state[1]
+        return self._compute_clip_rgb(self._parent.snapshot.clip_slot(track_idx, scene_idx))
+    
+    def _compute_clip_rgb(self, clip_slot):
+        """Read (r, g, b) of a clip slot from Live, black if there is no clip"""
+        if clip_slot is not None and clip_slot.has_clip:
+            try:
+                # Raw RGB color value
+                rgb_color = int(clip_slot.clip.color)
                 
-                # Send on 3 separate channels
-                self._color_controls_r[control_idx].send_value(r_value, True)
-                self._color_controls_g[control_idx].send_value(g_value, True)
-                self._color_controls_b[control_idx].send_value(b_value, True)
\ No newline at end of file
+                # Extract R, G, B channels via bit shifting
+                return ((rgb_color >> 16) & 0xFF,
+                        (rgb_color >> 8) & 0xFF,
+                        rgb_color & 0xFF)
+            except:
+                pass
+        
+        return (0, 0, 0)
+    
+    def _send_cell_color(self, control_idx, rgb):
+        """Send only the R/G/B channels that differ from the cached cell color"""
+        cached = self._color_cache[control_idx]
+        if cached == rgb:
+            return
+        
+        if COLOR_MODE == COLOR_MODE_SYSEX:
+            # Whole cell goes into the next frame
+            self._frame_cells.append((control_idx, rgb))
+            self._color_cache[control_idx] = rgb
+            return
+        
+        r_value, g_value, b_value = rgb
+        cc_num = self._color_ccs[control_idx]
+        
+        # Send on 3 separate channels
+        if cached is None or cached[0] != r_value:
+            self._parent.send_midi((CC_STATUS + RED_CHANNEL, cc_num, r_value))
+        if cached is None or cached[1] != g_value:
+            self._parent.send_midi((CC_STATUS + GREEN_CHANNEL, cc_num, g_value))
+        if cached is None or cached[2] != b_value:
+            self._parent.send_midi((CC_STATUS + BLUE_CHANNEL, cc_num, b_value))
+        
+        self._color_cache[control_idx] = rgb
+    
+    def flush_color_frame(self):
+        """SysEx mode: send queued cells as one frame, chunked to SYSEX_COLOR_CELLS_PER_MESSAGE"""
+        if not self._frame_cells:
+            return
+        
+        cells = self._frame_cells
+        self._frame_cells = []
+        
+        for start in range(0, len(cells), SYSEX_COLOR_CELLS_PER_MESSAGE):
+            message = [0xF0]
+            message.extend(SYSEX_COLOR_HEADER)
+            for control_idx, (r_value, g_value, b_value) in cells[start:start + SYSEX_COLOR_CELLS_PER_MESSAGE]:
+                # 7-bit safe: low 7 bits per channel, top bits collected in one byte
+                msbs = (r_value >> 7) | ((g_value >> 7) << 1) | ((b_value >> 7) << 2)
+                message.extend((control_idx, msbs, r_value & 0x7F, g_value & 0x7F, b_value & 0x7F))
+            message.append(0xF7)
+            self._parent.send_midi(tuple(message))
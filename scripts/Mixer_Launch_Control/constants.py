@@ -10,6 +10,11 @@ GRID_COLS = 8  # 8 tracks (matches 8-track mixer!)
 # Mixer configuration
 NUM_TRACKS = 8  # 2 modules × 4 tracks = 8 tracks
 
+# MIDI status bytes (channel is added)
+NOTE_ON_STATUS = 0x90
+NOTE_OFF_STATUS = 0x80
+CC_STATUS = 0xB0
+
 # MIDI channels
 MAIN_CHANNEL = 0
 RED_CHANNEL = 1
@@ -50,6 +55,17 @@ ARM_NOTE_START_2 = 56
 # Module 2: CC 76-91 (col 4-7)
 COLOR_CC_START = 60  # First module starts at CC 60
 
+# Color transport
+COLOR_MODE_CC = 0      # 3 CCs per cell on RED/GREEN/BLUE_CHANNEL
+COLOR_MODE_SYSEX = 1   # All changed cells packed into one SysEx frame
+COLOR_MODE = COLOR_MODE_CC
+
+# SysEx color frame: F0 <header> (<cell> <msbs> <r> <g> <b>)... F7
+# r/g/b carry the low 7 bits, msbs bit 0/1/2 the top bit of r/g/b
+SYSEX_MANUFACTURER_ID = 0x7D  # Non-commercial manufacturer ID
+SYSEX_COLOR_HEADER = (SYSEX_MANUFACTURER_ID, 0x01)  # 0x01 = color frame
+SYSEX_COLOR_CELLS_PER_MESSAGE = 16  # Larger frames are split into chunks
+
 # Navigation buttons
 TRACK_LEFT_NOTE = 44      # 1 track left
 TRACK_RIGHT_NOTE = 45     # 1 track right
@@ -60,6 +76,9 @@ BANK_RIGHT_NOTE = 61      # 4 tracks right (Channel 0)
 
 # Trigger CC
 TRIGGER_CC = 127
+TRIGGER_FULL_STATE = 127      # TRIGGER_CC value: resend everything
+TRIGGER_STATS_DUMP = 126      # TRIGGER_CC value: write traffic/latency stats to Live's log
+TRIGGER_PROFILE_TOGGLE = 125  # TRIGGER_CC value: start/stop a cProfile capture (PROFILE_CAPTURE)
 
 # LED values
 LED_OFF = 0
@@ -68,4 +87,117 @@ LED_PLAYING = 127
 LED_RECORDING = 120
 
 # Timing
-INIT_DELAY = 20
\ No newline at end of file
+INIT_DELAY = 20
+
+# Input engine
+# False: one _Framework ButtonElement per button (default)
+# True: buttons are looked up in a (status, id) -> handler table built once and
+#       dispatched from receive_midi - lighter startup and per-message cost
+USE_RAW_MIDI_INPUT = False
+
+# Output stage
+# True: each tick's note/CC output is held until the tick's rendering is done,
+#       then sent grouped by status byte (one message per send_midi call)
+GROUP_OUTPUT_BY_STATUS = False
+
+# Incremental resync - the surface stamps its output with a state version:
+#   F0 7D 02 <epoch> <version> F7  surface -> controller, everything up to <version> is sent
+#   F0 7D 03 <epoch> <version> F7  controller -> surface, last stamp it saw
+# A resync request gets only the cells changed since then, or a full dump once
+# the journal no longer reaches back that far. <epoch> is picked at random per
+# script instance - a stamp from an earlier instance (set or script reload) gets
+# a full dump too. Both are sent as 7-bit bytes, most significant first
+RESYNC_PROTOCOL = False
+RESYNC_JOURNAL_SIZE = 512    # Render steps kept (a full refresh is 89)
+RESYNC_VERSION_BITS = 21     # 3 bytes on the wire
+RESYNC_EPOCH_BITS = 14       # 2 bytes on the wire
+SYSEX_VERSION_STAMP = 0x02
+SYSEX_RESYNC_REQUEST = 0x03
+
+# Progressive full-state refresh - the trigger's full state is rendered over
+# this many display ticks (clip states, then mixer, then colors) with a notice
+# when it is complete. 1 = everything on the next tick
+PROGRESSIVE_REFRESH_TICKS = 4
+
+# Fader feedback
+# True: volume/pan/send values reach the controller through Live's own MIDI-map
+#       feedback (same scaling as input, no Python per parameter); a refresh
+#       just asks Live to rebuild the map, which resends every mapped value
+# False: Python reads each parameter and sends hand-scaled values
+# Native feedback never passes through the script's output: the output budget,
+# traffic counters, resync journal and checksum shadow exclude the faders (the
+# checksum check compares against the parameters, a resync always refreshes them)
+NATIVE_FADER_FEEDBACK = True
+
+# Continuous fader feedback for the Python path (NATIVE_FADER_FEEDBACK = False):
+# value listeners on the visible strips' volume/pan/sends, throttled per control.
+# A change goes out once FADER_FEEDBACK_INTERVAL has passed since the last send
+# and it moved at least FADER_FEEDBACK_MIN_DELTA steps; anything held back is
+# sent on the trailing edge, so the final value always arrives
+FADER_FEEDBACK_LISTENERS = True
+FADER_FEEDBACK_INTERVAL = 0.05  # Seconds
+FADER_FEEDBACK_MIN_DELTA = 2    # CC steps
+
+# Fader value tables - CC step <-> parameter value, piecewise linear over the
+# parameter range like Live's own CC mapping (Live's volume parameter already
+# carries the dB taper), with a detent landing exactly on 0 dB / pan center
+VOLUME_UNITY_VALUE = 0.85  # Live's volume parameter at 0 dB
+VOLUME_UNITY_STEP = 108    # round(0.85 * 127)
+PAN_CENTER_STEP = 64
+
+# Output budget - at most this many messages (SysEx: per 3 bytes) leave per
+# display tick so bulk refreshes don't overrun Live's MIDI output buffer.
+# The rest wait for the following ticks in priority order, and a newer value
+# for the same note/CC replaces the queued one. 0 = no limit (default): with a
+# budget every message is queued, so button LED echoes wait for the next tick
+OUTPUT_BUDGET = 0
+
+# Output priorities (lower is sent first)
+PRIORITY_CLIP_STATE = 0
+PRIORITY_MIX_LEDS = 1
+PRIORITY_FADERS = 2
+PRIORITY_COLORS = 3
+
+# Look-ahead cache - listeners and computed LED/RGB state kept for slots around
+# the session box so scrolling is a cache read plus a diffed send
+LOOKAHEAD_TRACKS = 0         # Columns cached each side of the box (GRID_COLS = one bank, 0 = off)
+LOOKAHEAD_SCENES = 0         # Rows cached above/below the box (GRID_ROWS = one bank)
+LOOKAHEAD_MAX_COLUMNS = 32   # Memory cap - least recently shown columns are evicted first
+
+# Render regions (marked dirty by components, flushed once per display tick)
+REGION_CLIP_LEDS = 'clip_leds'
+REGION_CLIP_COLORS = 'clip_colors'
+REGION_MIX_LEDS = 'mix_leds'
+REGION_FADERS = 'faders'
+
+# Traffic stats (debug) - outgoing messages/bytes per component and cause, dumped
+# to Live's log with TRIGGER_STATS_DUMP. False: no counting on the send path
+TRAFFIC_STATS = False
+TRAFFIC_RATE_WINDOW = 2.0  # Seconds covered by the rolling msgs/sec rate
+
+# Latency profiling - listener, button and trigger handlers are timed into
+# fixed-bucket histograms (dumped with TRIGGER_STATS_DUMP). False: handlers are
+# registered unwrapped, so there is no overhead at all
+LATENCY_PROFILING = False
+LATENCY_BUCKETS_US = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000)  # Upper bounds, plus one overflow bucket
+
+# Profile capture (debug) - TRIGGER_PROFILE_TOGGLE starts/stops a cProfile session
+# around the surface callbacks; stats go to GridMixer_profile_*.prof/.txt next to Live's Log.txt
+PROFILE_CAPTURE = False
+
+# Traffic causes
+CAUSE_LISTENER = 'listener'      # Live listeners (default)
+CAUSE_INPUT = 'input'            # Clip launch and mute/solo/arm buttons
+CAUSE_NAVIGATION = 'navigation'  # Track/scene/bank navigation
+CAUSE_TRIGGER = 'trigger'        # TRIGGER_CC
+CAUSE_SETUP = 'setup'            # Delayed setup
+
+# Divergence check - the controller reports checksums of what it shows:
+#   F0 7D 04 (<region> <sum msb> <sum lsb>)... F7
+# region = index in CHECKSUM_REGIONS, sum = value * (key + 1) summed over
+# everything it shows, mod 16384. key = note (clip/mixer LEDs), CC (faders) or
+# cell * 3 + 0/1/2 for r/g/b (colors, 8-bit values, cell = row * 8 + col).
+# Regions whose sum differs from what the surface sent are resent
+CHECKSUM_HEALING = False
+SYSEX_CHECKSUM_REPORT = 0x04
+CHECKSUM_REGIONS = (REGION_CLIP_LEDS, REGION_CLIP_COLORS, REGION_MIX_LEDS, REGION_FADERS)
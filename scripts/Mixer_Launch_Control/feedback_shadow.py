@@ -0,0 +1,67 @@
+"""
+Grid Mixer and Launch Control - Feedback Shadow
+What the controller should be showing, per region, rebuilt from the MIDI that
+actually went out - compared against checksums the controller reports
+"""
+from .constants import (MAIN_CHANNEL, RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL, CLIP_LAUNCH_CHANNEL,
+                        NOTE_ON_STATUS, NOTE_OFF_STATUS, CC_STATUS, SYSEX_COLOR_HEADER,
+                        REGION_CLIP_LEDS, REGION_CLIP_COLORS, REGION_MIX_LEDS, REGION_FADERS, CHECKSUM_REGIONS)
+
+CHECKSUM_MASK = 0x3FFF  # Two 7-bit bytes on the wire
+_COLOR_CHANNELS = (RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL)
+
+
+def region_checksum(values):
+    """Sum of value * (key + 1) - cells showing 0 don't count, so unsent cells match a blank controller"""
+    return sum(value * (key + 1) for key, value in values.items()) & CHECKSUM_MASK
+
+
+class FeedbackShadow:
+    """Last value sent per key, per region (keys as in region_checksum)"""
+    
+    def __init__(self):
+        self._values = dict((region, {}) for region in CHECKSUM_REGIONS)
+        self._color_cells = {}  # color CC -> grid cell (CC color mode)
+    
+    def set_color_cells(self, color_cells):
+        self._color_cells = color_cells
+    
+    def record(self, midi_bytes):
+        """Update the shadow from one outgoing message"""
+        status = midi_bytes[0]
+        if status == 0xF0:
+            if tuple(midi_bytes[1:1 + len(SYSEX_COLOR_HEADER)]) == SYSEX_COLOR_HEADER:
+                self._record_color_frame(midi_bytes[1 + len(SYSEX_COLOR_HEADER):-1])
+            return
+        if len(midi_bytes) < 3:
+            return
+        
+        kind = status & 0xF0
+        channel = status & 0x0F
+        identifier, value = midi_bytes[1], midi_bytes[2]
+        if kind == NOTE_OFF_STATUS:
+            kind, value = NOTE_ON_STATUS, 0
+        
+        if kind == NOTE_ON_STATUS:
+            if channel == CLIP_LAUNCH_CHANNEL:
+                self._values[REGION_CLIP_LEDS][identifier] = value
+            elif channel == MAIN_CHANNEL:
+                self._values[REGION_MIX_LEDS][identifier] = value
+        elif kind == CC_STATUS:
+            if channel in _COLOR_CHANNELS:
+                cell = self._color_cells.get(identifier)
+                if cell is not None:
+                    self._values[REGION_CLIP_COLORS][cell * 3 + _COLOR_CHANNELS.index(channel)] = value
+            elif channel == MAIN_CHANNEL:
+                self._values[REGION_FADERS][identifier] = value
+    
+    def _record_color_frame(self, payload):
+        """(cell, msbs, r, g, b) groups of a SysEx color frame"""
+        colors = self._values[REGION_CLIP_COLORS]
+        for start in range(0, len(payload) - 4, 5):
+            cell, msbs = payload[start], payload[start + 1]
+            for index in range(3):
+                colors[cell * 3 + index] = payload[start + 2 + index] | (((msbs >> index) & 1) << 7)
+    
+    def checksum(self, region):
+        return region_checksum(self._values[region])
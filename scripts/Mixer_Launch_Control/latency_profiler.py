@@ -0,0 +1,65 @@
+"""
+Grid Mixer and Launch Control - Latency Profiler
+Fixed-bucket execution time histograms per listener/input handler
+"""
+import time
+
+from .constants import LATENCY_BUCKETS_US
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class LatencyHistogram:
+    """Call count, total/max time and bucket counts for one handler"""
+    
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_US) + 1)  # Last bucket = above the largest bound
+        self.calls = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+    
+    def record(self, elapsed_us):
+        index = 0
+        for bound in LATENCY_BUCKETS_US:
+            if elapsed_us <= bound:
+                break
+            index += 1
+        self.buckets[index] += 1
+        self.calls += 1
+        self.total_us += elapsed_us
+        if elapsed_us > self.max_us:
+            self.max_us = elapsed_us
+
+
+class LatencyProfiler:
+    """Wraps callbacks at registration - handlers that are never wrapped cost nothing"""
+    
+    def __init__(self):
+        self._histograms = {}  # handler name -> LatencyHistogram
+    
+    def wrap(self, name, callback):
+        """Return callback timed into the histogram for name"""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram()
+        
+        def timed(*args, **kwargs):
+            start = _clock()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                histogram.record((_clock() - start) * 1e6)
+        return timed
+    
+    def report(self):
+        """Human readable histograms, most expensive handler (total time) first"""
+        header = " ".join("<=%d" % bound for bound in LATENCY_BUCKETS_US) + " >%d" % LATENCY_BUCKETS_US[-1]
+        lines = ["Handler latency (us buckets: %s)" % header]
+        ranked = sorted(self._histograms.items(), key=lambda item: -item[1].total_us)
+        for name, histogram in ranked:
+            if not histogram.calls:
+                continue
+            lines.append("  %s: %d calls, avg %.0f us, max %.0f us, total %.1f ms | %s"
+                         % (name, histogram.calls, histogram.total_us / histogram.calls, histogram.max_us,
+                            histogram.total_us / 1000.0, " ".join(str(count) for count in histogram.buckets)))
+        return lines
@@ -0,0 +1,69 @@
+"""
+Grid Mixer and Launch Control - Listener Registry
+Keeps exactly one listener per (Live object, property)
+"""
+
+
+def object_key(obj):
+    """Stable identity for a Live object - proxies of the same object share _live_ptr"""
+    return getattr(obj, '_live_ptr', None) or id(obj)
+
+
+class ListenerRegistry:
+    """Registers Live listeners keyed by (object, property) and diffs against a desired set"""
+    
+    def __init__(self):
+        self._registered = {}  # (object key, property) -> (obj, property, callback)
+    
+    def add(self, obj, prop, callback):
+        """Register a listener unless one is already registered for (obj, prop)"""
+        key = (object_key(obj), prop)
+        if key in self._registered:
+            return False
+        
+        add_listener = getattr(obj, 'add_%s_listener' % prop)
+        has_listener = getattr(obj, '%s_has_listener' % prop)
+        if not has_listener(callback):
+            add_listener(callback)
+        self._registered[key] = (obj, prop, callback)
+        return True
+    
+    def remove(self, obj, prop):
+        """Remove the listener registered for (obj, prop), if any"""
+        entry = self._registered.pop((object_key(obj), prop), None)
+        if entry is not None:
+            self._detach(entry)
+    
+    def sync(self, desired):
+        """
+        Make the registered set match desired [(obj, property, callback), ...]
+        Listeners already registered are kept, missing ones added, stale ones removed
+        """
+        wanted = {}
+        for obj, prop, callback in desired:
+            wanted[(object_key(obj), prop)] = (obj, prop, callback)
+        
+        for key in [k for k in self._registered if k not in wanted]:
+            self._detach(self._registered.pop(key))
+        
+        for key, (obj, prop, callback) in wanted.items():
+            if key not in self._registered:
+                self.add(obj, prop, callback)
+    
+    def clear(self):
+        """Remove every registered listener"""
+        for entry in self._registered.values():
+            self._detach(entry)
+        self._registered = {}
+    
+    def count(self):
+        """Number of registered listeners"""
+        return len(self._registered)
+    
+    def _detach(self, entry):
+        obj, prop, callback = entry
+        try:
+            if getattr(obj, '%s_has_listener' % prop)(callback):
+                getattr(obj, 'remove_%s_listener' % prop)(callback)
+        except:
+            pass  # Object already deleted in Live
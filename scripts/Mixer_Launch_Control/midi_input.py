@@ -0,0 +1,93 @@
+"""
+Grid Mixer and Launch Control - Raw MIDI Input Engine
+Optional replacement for per-button _Framework elements (see USE_RAW_MIDI_INPUT)
+"""
+import Live
+from _Framework.InputControlElement import MIDI_NOTE_TYPE
+from .constants import NOTE_ON_STATUS, NOTE_OFF_STATUS, CC_STATUS
+
+
+class RawControl:
+    """Lightweight button/CC with the ButtonElement API used by the components"""
+    
+    __slots__ = ('_dispatcher', '_status', '_identifier', '_listeners')
+    
+    def __init__(self, dispatcher, status, identifier):
+        self._dispatcher = dispatcher
+        self._status = status
+        self._identifier = identifier
+        self._listeners = []  # (callback, identify_sender)
+    
+    def message_channel(self):
+        return self._status & 0x0F
+    
+    def message_identifier(self):
+        return self._identifier
+    
+    def add_value_listener(self, callback, identify_sender=False):
+        if not self.value_has_listener(callback):
+            self._listeners.append((callback, identify_sender))
+    
+    def remove_value_listener(self, callback):
+        self._listeners = [l for l in self._listeners if l[0] != callback]
+    
+    def value_has_listener(self, callback):
+        for cb, _ in self._listeners:
+            if cb == callback:
+                return True
+        return False
+    
+    def receive_value(self, value):
+        for callback, identify_sender in self._listeners:
+            if identify_sender:
+                callback(value, self)
+            else:
+                callback(value)
+    
+    def send_value(self, value, force=False):
+        """Send feedback - no framework caching, callers do their own diffing"""
+        self._dispatcher.send((self._status, self._identifier, int(value)))
+
+
+class MidiDispatcher:
+    """(status, id) -> control lookup table, fed from the surface's receive_midi"""
+    
+    def __init__(self, parent):
+        self._parent = parent
+        self._table = {}  # (note on / CC status incl. channel, note or CC number) -> RawControl
+    
+    def create_control(self, msg_type, channel, identifier):
+        """Create a control and add it to the dispatch table"""
+        status = (NOTE_ON_STATUS if msg_type == MIDI_NOTE_TYPE else CC_STATUS) + channel
+        control = RawControl(self, status, identifier)
+        self._table[(status, identifier)] = control
+        return control
+    
+    def receive_midi(self, midi_bytes):
+        """Dispatch a 3-byte message - returns False if it isn't in the table"""
+        if len(midi_bytes) != 3:
+            return False
+        
+        status, identifier, value = midi_bytes
+        if status & 0xF0 == NOTE_OFF_STATUS:
+            status, value = status + (NOTE_ON_STATUS - NOTE_OFF_STATUS), 0
+        
+        control = self._table.get((status, identifier))
+        if control is None:
+            return False
+        
+        control.receive_value(value)
+        return True
+    
+    def build_midi_map(self, midi_map_handle):
+        """Ask Live to forward every table entry to receive_midi"""
+        script_handle = self._parent._c_instance.handle()
+        for status, identifier in self._table:
+            channel = status & 0x0F
+            if status & 0xF0 == NOTE_ON_STATUS:
+                Live.MidiMap.forward_midi_note(script_handle, midi_map_handle, channel, identifier)
+            else:
+                Live.MidiMap.forward_midi_cc(script_handle, midi_map_handle, channel, identifier)
+    
+    def send(self, midi_bytes):
+        self._parent.send_midi(midi_bytes)
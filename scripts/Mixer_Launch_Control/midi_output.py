@@ -0,0 +1,121 @@
+"""
+Grid Mixer and Launch Control - MIDI Output Buffer
+Collects a tick's channel messages and sends them grouped by status byte,
+optionally behind a per-tick output budget
+"""
+from collections import OrderedDict
+from .constants import (RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL, CLIP_LAUNCH_CHANNEL, CC_STATUS,
+                        PRIORITY_CLIP_STATE, PRIORITY_MIX_LEDS, PRIORITY_FADERS, PRIORITY_COLORS)
+
+
+def group_by_status(messages):
+    """
+    Messages sorted by status byte - stable, so later values for the same
+    address still win
+    """
+    return sorted(messages, key=lambda m: m[0])
+
+
+class MidiOutputBuffer:
+    """
+    Buffers channel voice messages until flush, then sends them grouped by
+    status byte, one per call - SysEx is never buffered
+    """
+    
+    def __init__(self, send_midi):
+        self._send_midi = send_midi
+        self._messages = []
+    
+    def add(self, midi_bytes):
+        """Queue a message - returns False if it has to be sent right away"""
+        if not midi_bytes:
+            return False
+        if midi_bytes[0] == 0xF0:
+            self.flush()  # Keep SysEx behind the messages queued before it
+            return False
+        self._messages.append(tuple(midi_bytes))
+        return True
+    
+    def flush(self):
+        """Send everything queued since the last flush, one message per call"""
+        if not self._messages:
+            return
+        
+        messages = self._messages
+        self._messages = []
+        for message in group_by_status(messages):
+            self._send_midi(message)
+    
+    def clear(self):
+        self._messages = []
+
+
+def message_priority(midi_bytes):
+    """Output priority from the message address (lower goes first)"""
+    status = midi_bytes[0]
+    if status == 0xF0:
+        return PRIORITY_COLORS
+    channel = status & 0x0F
+    if channel in (RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL):
+        return PRIORITY_COLORS
+    if channel == CLIP_LAUNCH_CHANNEL:
+        return PRIORITY_CLIP_STATE
+    if status & 0xF0 == CC_STATUS:
+        return PRIORITY_FADERS
+    return PRIORITY_MIX_LEDS
+
+
+def message_cost(midi_bytes):
+    """Budget units - one per 3 bytes, so a SysEx frame costs what its bytes would as CCs"""
+    return max(1, (len(midi_bytes) + 2) // 3)
+
+
+class OutputLimiter:
+    """
+    Queues outgoing MIDI and releases at most budget units per flush, in
+    priority order - a newer value for the same note/CC replaces the queued one.
+    Each message carries a tag (the traffic cause) through to send_midi(message, tag)
+    """
+    
+    def __init__(self, send_midi, budget):
+        self._send_midi = send_midi
+        self._budget = budget
+        self._queues = [OrderedDict() for _ in range(PRIORITY_COLORS + 1)]  # One FIFO per priority
+        self._sysex_serial = 0  # SysEx frames are never replaced
+    
+    def add(self, midi_bytes, tag=None):
+        """Queue a message, replacing a queued value (and its tag) for the same address"""
+        if not midi_bytes:
+            return
+        status = midi_bytes[0]
+        if status == 0xF0:
+            self._sysex_serial += 1
+            key = (status, self._sysex_serial)
+        else:
+            if status & 0xF0 == 0x80:
+                status |= 0x10  # Note off and note on address the same LED
+            key = (status, midi_bytes[1] if len(midi_bytes) > 1 else None)
+        # Replacing an existing key keeps its place in the queue
+        self._queues[message_priority(midi_bytes)][key] = (tuple(midi_bytes), tag)
+    
+    def flush(self):
+        """Send up to the budget - whatever is left waits for the next flush"""
+        budget = self._budget
+        for queue in self._queues:
+            while queue:
+                key = next(iter(queue))
+                cost = message_cost(queue[key][0])
+                if cost > budget and budget < self._budget:
+                    return  # An oversized frame still goes out alone on a fresh budget
+                self._send_midi(*queue.pop(key))
+                budget -= cost
+                if budget <= 0:
+                    return
+    
+    def pending(self):
+        """Messages waiting for a later tick"""
+        return sum(len(queue) for queue in self._queues)
+    
+    def clear(self):
+        for queue in self._queues:
+            queue.clear()
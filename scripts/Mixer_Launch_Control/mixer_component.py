@@ -3,15 +3,22 @@ Grid Mixer and Launch Control - Mixer Component
 Handles volume, pan, sends, mute, solo, arm controls
 8-TRACK MIXER: 2 modules × 4 tracks
 """
-from _Framework.InputControlElement import MIDI_CC_TYPE, MIDI_NOTE_TYPE
+import time
+from _Framework.InputControlElement import MIDI_CC_TYPE
 from _Framework.SliderElement import SliderElement
-from _Framework.ButtonElement import ButtonElement
 from _Framework.MixerComponent import MixerComponent as FrameworkMixer
-from .constants import (MAIN_CHANNEL, NUM_TRACKS,
+from .constants import (MAIN_CHANNEL, NUM_TRACKS, REGION_MIX_LEDS, REGION_FADERS,
+                      NATIVE_FADER_FEEDBACK, FADER_FEEDBACK_LISTENERS, FADER_FEEDBACK_INTERVAL, FADER_FEEDBACK_MIN_DELTA,
                       VOLUME_CC_START, PAN_CC_START, SEND_A_CC_START, SEND_B_CC_START,
                       MUTE_NOTE_START, SOLO_NOTE_START, ARM_NOTE_START,
                       VOLUME_CC_START_2, PAN_CC_START_2, SEND_A_CC_START_2, SEND_B_CC_START_2,
                       MUTE_NOTE_START_2, SOLO_NOTE_START_2, ARM_NOTE_START_2)
+from .listener_registry import ListenerRegistry, object_key
+from .value_throttle import ValueThrottle
+from .value_scaling import VOLUME_TABLE, PAN_TABLE, SEND_TABLE
+
+# Mixer LED rows - render cell (row, strip) maps to a track property
+MIX_LED_PROPERTIES = ('mute', 'solo', 'arm')
 
 
 class MixerComponent:
@@ -28,7 +35,15 @@ class MixerComponent:
         self._solo_buttons = []
         self._arm_buttons = []
         self._listener_refs = []
-        self._track_state_listeners = []
+        self._track_listeners = ListenerRegistry()  # One mute/solo/arm listener per windowed track
+        self._visible_strips = {}  # object key of visible track -> strip index
+        
+        # Python fader feedback follows parameter changes on the visible strips, throttled per slider
+        self._fader_listeners = ListenerRegistry()
+        self._fader_throttle = None
+        self._fader_cells = {}  # slider -> (row, strip) in REGION_FADERS
+        if not NATIVE_FADER_FEEDBACK and FADER_FEEDBACK_LISTENERS:
+            self._fader_throttle = ValueThrottle(self._send_throttled, FADER_FEEDBACK_INTERVAL, FADER_FEEDBACK_MIN_DELTA)
         
         self._setup_mixer()
         self._setup_mix_controls()
@@ -71,18 +86,25 @@ class MixerComponent:
             strip.set_volume_control(vol)
             strip.set_pan_control(pan)
             strip.set_send_controls((sendA, sendB))
+        
+        if self._fader_throttle is not None:
+            # The throttled listeners are the fader feedback - no duplicate from Live's MIDI map
+            for slider in self._vol_sliders + self._pan_sliders + self._sendA + self._sendB:
+                slider.set_feedback_delay(-1)
     
     def _setup_mix_controls(self):
         """Setup mute, solo, arm buttons for 8 tracks"""
+        profiled = self._parent.profiled
+        
         # Module 1: Tracks 0-3
         for i in range(4):
-            mute = ButtonElement(True, MIDI_NOTE_TYPE, MAIN_CHANNEL, MUTE_NOTE_START + i)
-            solo = ButtonElement(True, MIDI_NOTE_TYPE, MAIN_CHANNEL, SOLO_NOTE_START + i)
-            arm = ButtonElement(True, MIDI_NOTE_TYPE, MAIN_CHANNEL, ARM_NOTE_START + i)
+            mute = self._parent.create_button(MAIN_CHANNEL, MUTE_NOTE_START + i)
+            solo = self._parent.create_button(MAIN_CHANNEL, SOLO_NOTE_START + i)
+            arm = self._parent.create_button(MAIN_CHANNEL, ARM_NOTE_START + i)
             
-            mute.add_value_listener(lambda v, i=i: v > 0 and self._toggle_track(i, "mute"))
-            solo.add_value_listener(lambda v, i=i: v > 0 and self._toggle_track(i, "solo"))
-            arm.add_value_listener(lambda v, i=i: v > 0 and self._toggle_track(i, "arm"))
+            mute.add_value_listener(profiled('button.mute', lambda v, i=i: v > 0 and self._toggle_track(i, "mute")))
+            solo.add_value_listener(profiled('button.solo', lambda v, i=i: v > 0 and self._toggle_track(i, "solo")))
+            arm.add_value_listener(profiled('button.arm', lambda v, i=i: v > 0 and self._toggle_track(i, "arm")))
             
             self._mute_buttons.append(mute)
             self._solo_buttons.append(solo)
@@ -90,14 +112,14 @@ class MixerComponent:
         
         # Module 2: Tracks 4-7
         for i in range(4):
-            mute = ButtonElement(True, MIDI_NOTE_TYPE, MAIN_CHANNEL, MUTE_NOTE_START_2 + i)
-            solo = ButtonElement(True, MIDI_NOTE_TYPE, MAIN_CHANNEL, SOLO_NOTE_START_2 + i)
-            arm = ButtonElement(True, MIDI_NOTE_TYPE, MAIN_CHANNEL, ARM_NOTE_START_2 + i)
+            mute = self._parent.create_button(MAIN_CHANNEL, MUTE_NOTE_START_2 + i)
+            solo = self._parent.create_button(MAIN_CHANNEL, SOLO_NOTE_START_2 + i)
+            arm = self._parent.create_button(MAIN_CHANNEL, ARM_NOTE_START_2 + i)
             
             track_idx = i + 4
-            mute.add_value_listener(lambda v, idx=track_idx: v > 0 and self._toggle_track(idx, "mute"))
-            solo.add_value_listener(lambda v, idx=track_idx: v > 0 and self._toggle_track(idx, "solo"))
-            arm.add_value_listener(lambda v, idx=track_idx: v > 0 and self._toggle_track(idx, "arm"))
+            mute.add_value_listener(profiled('button.mute', lambda v, idx=track_idx: v > 0 and self._toggle_track(idx, "mute")))
+            solo.add_value_listener(profiled('button.solo', lambda v, idx=track_idx: v > 0 and self._toggle_track(idx, "solo")))
+            arm.add_value_listener(profiled('button.arm', lambda v, idx=track_idx: v > 0 and self._toggle_track(idx, "arm")))
             
             self._mute_buttons.append(mute)
             self._solo_buttons.append(solo)
@@ -106,118 +128,198 @@ class MixerComponent:
     def _setup_control_listeners(self):
         """Setup listeners on sliders to select tracks"""
         for i in range(NUM_TRACKS):
-            for control in [self._vol_sliders[i], self._pan_sliders[i], self._sendA[i], self._sendB[i]]:
+            for row, control in enumerate([self._vol_sliders[i], self._pan_sliders[i], self._sendA[i], self._sendB[i]]):
+                self._fader_cells[control] = (row, i)
+                
                 def make_handler(idx):
                     def handler(v, sender=None):
-                        t = self._parent.track_offset + idx
-                        if t < len(self._parent.song().tracks):
-                            self._parent.song().view.selected_track = self._parent.song().tracks[t]
+                        track = self._parent.snapshot.track(self._parent.track_offset + idx)
+                        if track is not None:
+                            self._parent.song().view.selected_track = track
                     return handler
                 
-                h = make_handler(i)
+                h = self._parent.profiled('control.select_track', make_handler(i))
                 control.add_value_listener(h, False)
+                
+                if self._fader_throttle is not None:
+                    # The controller already shows what it sent - nothing to echo back
+                    control.add_value_listener(
+                        lambda v, control=control: self._fader_throttle.sent(control, v, time.time()), False)
                 self._listener_refs.append((control, h))
     
     def _toggle_track(self, index, attr):
-        """Toggle mute/solo/arm on track"""
-        idx = self._parent.track_offset + index
-        if idx >= len(self._parent.song().tracks):
+        """Toggle mute/solo/arm on track - the track's listener marks the LED for the next tick"""
+        track = self._parent.snapshot.track(self._parent.track_offset + index)
+        if track is None:
             return
         
-        track = self._parent.song().tracks[idx]
-        
         if attr == "mute":
             track.mute = not track.mute
-            self._mute_buttons[index].send_value(127 if track.mute else 0, True)
         elif attr == "solo":
             track.solo = not track.solo
-            self._solo_buttons[index].send_value(127 if track.solo else 0, True)
         elif attr == "arm" and track.can_be_armed:
             track.arm = not track.arm
-            self._arm_buttons[index].send_value(127 if track.arm else 0, True)
     
     def update_mix_leds(self):
         """Update all mix control LEDs for 8 tracks"""
         for i in range(NUM_TRACKS):
-            idx = self._parent.track_offset + i
-            if idx >= len(self._parent.song().tracks):
+            track = self._parent.snapshot.track(self._parent.track_offset + i)
+            if track is None:
                 continue
             
-            track = self._parent.song().tracks[idx]
-            
-            self._mute_buttons[i].send_value(127 if track.mute else 0, True)
-            self._solo_buttons[i].send_value(127 if track.solo else 0, True)
-            
-            if track.can_be_armed:
-                self._arm_buttons[i].send_value(127 if track.arm else 0, True)
-            else:
-                self._arm_buttons[i].send_value(0, True)
+            for row in range(len(MIX_LED_PROPERTIES)):
+                self._send_mix_led(row, i, track)
+    
+    def update_mix_led(self, row, strip):
+        """Update one mute/solo/arm LED (row indexes MIX_LED_PROPERTIES)"""
+        track = self._parent.snapshot.track(self._parent.track_offset + strip)
+        if track is not None:
+            self._send_mix_led(row, strip, track)
+    
+    def _send_mix_led(self, row, strip, track):
+        """Send a single mix LED for the track shown on strip"""
+        buttons = (self._mute_buttons, self._solo_buttons, self._arm_buttons)[row]
+        attr = MIX_LED_PROPERTIES[row]
+        
+        if attr == "arm" and not track.can_be_armed:
+            buttons[strip].send_value(0, True)
+        else:
+            buttons[strip].send_value(127 if getattr(track, attr) else 0, True)
+    
+    def _on_track_state_changed(self, track, row):
+        """Mute/solo/arm listener - only the visible strip showing this track is updated"""
+        strip = self._visible_strips.get(object_key(track))
+        if strip is not None:
+            self._parent.mark_dirty(REGION_MIX_LEDS, (row, strip))
+    
+    def _update_visible_strips(self):
+        """Rebuild the track -> strip lookup for the current window"""
+        tracks = self._parent.snapshot.tracks
+        offset = self._parent.track_offset
+        self._visible_strips = dict((object_key(tracks[idx]), idx - offset)
+                                    for idx in range(offset, min(offset + NUM_TRACKS, len(tracks))))
     
     def set_track_offset(self, offset):
-        """Update mixer track offset"""
+        """Update mixer track offset - listeners follow the window incrementally"""
         self._mixer.set_track_offset(offset)
+        self.setup_track_listeners()
+        if self._fader_throttle is not None:
+            # A value held for a slider's previous track would go out ahead of the redraw
+            self._fader_throttle.drop_pending()
+            self._parent.mark_dirty(REGION_FADERS)  # New strips show their values right away
     
-    def send_full_state(self):
-        """Send current values of all mixer controls for 8 tracks"""
+    def refresh_fader_feedback(self):
+        """
+        Resend fader values (full refresh, resync, checksum repair). With
+        NATIVE_FADER_FEEDBACK Live sends them - at most one map rebuild per
+        request, navigation needs none (re-mapping the strips rebuilds the map)
+        """
+        if NATIVE_FADER_FEEDBACK:
+            self._parent.request_fader_feedback()
+        else:
+            self.send_fader_values()
+    
+    def fader_feedback_values(self):
+        """CC -> value each visible fader shows (checksum expectation - same tables as send_fader_values)"""
+        values = {}
+        for i in range(NUM_TRACKS):
+            track = self._parent.snapshot.track(self._parent.track_offset + i)
+            if track is not None:
+                for slider, value in self._fader_values(i, track):
+                    values[slider.message_identifier()] = value
+        return values
+    
+    def send_fader_values(self):
+        """Send current volume, pan and send values for 8 tracks (Python path)"""
+        now = time.time()
         for i in range(NUM_TRACKS):
-            idx = self._parent.track_offset + i
-            if idx >= len(self._parent.song().tracks):
+            track = self._parent.snapshot.track(self._parent.track_offset + i)
+            if track is None:
                 continue
             
-            track = self._parent.song().tracks[idx]
-            
-            self._vol_sliders[i].send_value(int(track.mixer_device.volume.value * 127), True)
-            pan = track.mixer_device.panning.value
-            self._pan_sliders[i].send_value(int((pan + 1.0) * 63.5), True)
-            
-            sends = track.mixer_device.sends
-            if len(sends) > 0:
-                self._sendA[i].send_value(int(sends[0].value * 127), True)
-            if len(sends) > 1:
-                self._sendB[i].send_value(int(sends[1].value * 127), True)
+            for slider, value in self._fader_values(i, track):
+                slider.send_value(value, True)
+                if self._fader_throttle is not None:
+                    self._fader_throttle.sent(slider, value, now)
+    
+    def _fader_values(self, strip, track):
+        """(slider, CC value) for the strip's volume, pan and sends"""
+        device = track.mixer_device
+        values = [(self._vol_sliders[strip], VOLUME_TABLE.step(device.volume.value)),
+                  (self._pan_sliders[strip], PAN_TABLE.step(device.panning.value))]
+        
+        sends = device.sends
+        if len(sends) > 0:
+            values.append((self._sendA[strip], SEND_TABLE.step(sends[0].value)))
+        if len(sends) > 1:
+            values.append((self._sendB[strip], SEND_TABLE.step(sends[1].value)))
+        return values
+    
+    def _on_fader_param_changed(self, track, index):
+        """Volume/pan/send listener - the new value is held by the throttle until the next tick"""
+        strip = self._visible_strips.get(object_key(track))
+        if strip is None:
+            return
+        
+        slider, value = self._fader_values(strip, track)[index]
+        self._fader_throttle.update(slider, value, time.time())
+    
+    def _send_throttled(self, slider, value):
+        """Throttle output - sent outside the render scheduler, so journaled here for resync"""
+        slider.send_value(value, True)
+        self._parent.record_sent(REGION_FADERS, self._fader_cells[slider])
+    
+    def flush_fader_feedback(self):
+        """Send the held fader values the throttle lets through (every display tick)"""
+        if self._fader_throttle is not None:
+            self._fader_throttle.flush(time.time())
+    
+    def _setup_fader_listeners(self):
+        """Value listeners on the visible strips' mixer parameters (Python fader feedback)"""
+        def make_cb(track, index):
+            return self._parent.profiled('listener.fader', lambda: self._on_fader_param_changed(track, index))
         
-        self.update_mix_leds()
+        offset = self._parent.track_offset
+        desired = []
+        for track in self._parent.snapshot.tracks[offset:offset + NUM_TRACKS]:
+            device = track.mixer_device
+            params = (device.volume, device.panning) + tuple(device.sends[:2])  # Order of _fader_values
+            for index, param in enumerate(params):
+                desired.append((param, 'value', make_cb(track, index)))
+        self._fader_listeners.sync(desired)
     
     def setup_track_listeners(self):
-        """Setup track listeners for mute/solo/arm changes"""
-        for track in self._parent.song().tracks:
-            def make_mute_cb():
-                return lambda: self.update_mix_leds()
-            
-            def make_solo_cb():
-                return lambda: self.update_mix_leds()
-            
-            def make_arm_cb():
-                return lambda: self.update_mix_leds()
-            
-            mute_cb = make_mute_cb()
-            solo_cb = make_solo_cb()
-            arm_cb = make_arm_cb()
-            
-            if not track.mute_has_listener(mute_cb):
-                track.add_mute_listener(mute_cb)
-                self._track_state_listeners.append((track, 'mute', mute_cb))
-            
-            if not track.solo_has_listener(solo_cb):
-                track.add_solo_listener(solo_cb)
-                self._track_state_listeners.append((track, 'solo', solo_cb))
+        """
+        Setup mute/solo/arm listeners for the visible strips - off-screen state is
+        read when a strip scrolls in. Safe to call repeatedly - only tracks
+        entering/leaving the window are rebound
+        """
+        def make_cb(track, row):
+            return self._parent.profiled('listener.' + MIX_LED_PROPERTIES[row],
+                                         lambda: self._on_track_state_changed(track, row))
+        
+        offset = self._parent.track_offset
+        desired = []
+        for track in self._parent.snapshot.tracks[offset:offset + NUM_TRACKS]:
+            desired.append((track, 'mute', make_cb(track, 0)))
+            desired.append((track, 'solo', make_cb(track, 1)))
             
             # Add ARM listener (for audio/MIDI tracks)
-            if track.can_be_armed and not track.arm_has_listener(arm_cb):
-                track.add_arm_listener(arm_cb)
-                self._track_state_listeners.append((track, 'arm', arm_cb))
+            if track.can_be_armed:
+                desired.append((track, 'arm', make_cb(track, 2)))
+        
+        # Already registered listeners are kept, tracks that left the window are dropped
+        self._track_listeners.sync(desired)
+        self._update_visible_strips()
+        
+        if self._fader_throttle is not None:
+            self._setup_fader_listeners()
+    
+    def listener_count(self):
+        """Number of registered track listeners (bounded by the window, not the song size)"""
+        return self._track_listeners.count() + self._fader_listeners.count()
     
     def disconnect(self):
         """Cleanup on disconnect"""
-        for listener_info in self._track_state_listeners:
-            try:
-                track, listener_type, cb = listener_info
-                
-                if listener_type == 'mute' and track.mute_has_listener(cb):
-                    track.remove_mute_listener(cb)
-                elif listener_type == 'solo' and track.solo_has_listener(cb):
-                    track.remove_solo_listener(cb)
-                elif listener_type == 'arm' and track.arm_has_listener(cb):
-                    track.remove_arm_listener(cb)
-            except:
-                pass
\ No newline at end of file
+        self._track_listeners.clear()
+        self._fader_listeners.clear()
@@ -0,0 +1,91 @@
+"""
+Grid Mixer and Launch Control - Profile Capture
+cProfile session around the surface callbacks, started/stopped from the controller
+"""
+import glob
+import os
+import sys
+import time
+
+
+def live_log_directory():
+    """Folder holding Live's Log.txt (newest Live version wins), else the script folder"""
+    if sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Preferences/Ableton')
+    else:
+        base = os.path.join(os.environ.get('APPDATA', ''), 'Ableton')
+    
+    logs = glob.glob(os.path.join(base, 'Live *', 'Log.txt'))
+    logs += glob.glob(os.path.join(base, 'Live *', 'Preferences', 'Log.txt'))
+    if not logs:
+        return os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(max(logs, key=os.path.getmtime))
+
+
+class ProfileCapture:
+    """Profiles only while a surface callback runs - nested callbacks join the outer one"""
+    
+    def __init__(self, directory, log):
+        self._directory = directory
+        self._log = log  # Called with a status line once the stats are written
+        self._profile = None
+        self._depth = 0  # Surface callbacks currently on the stack
+        self._stop_requested = False
+    
+    @property
+    def active(self):
+        return self._profile is not None
+    
+    def start(self):
+        import cProfile
+        self._profile = cProfile.Profile()
+        self._stop_requested = False
+    
+    def stop(self):
+        """Stop capturing - stats are written once the running callback returns"""
+        if self._profile is None:
+            return
+        if self._depth:
+            self._stop_requested = True
+        else:
+            self._write()
+    
+    def call(self, callback, *args, **kwargs):
+        """Run callback, profiled while a capture is active"""
+        profile = self._profile
+        if profile is None or self._depth:
+            return callback(*args, **kwargs)
+        
+        self._depth += 1
+        profile.enable()
+        try:
+            return callback(*args, **kwargs)
+        finally:
+            profile.disable()
+            self._depth -= 1
+            if self._stop_requested:
+                self._write()
+    
+    def wrap(self, callback):
+        """Return callback routed through call()"""
+        def captured(*args, **kwargs):
+            return self.call(callback, *args, **kwargs)
+        return captured
+    
+    def _write(self):
+        """Dump the .prof stats plus a readable .txt summary, then end the session"""
+        import pstats
+        profile = self._profile
+        self._profile = None
+        self._stop_requested = False
+        
+        path = os.path.join(self._directory, time.strftime('GridMixer_profile_%Y%m%d_%H%M%S.prof'))
+        try:
+            profile.dump_stats(path)
+            with open(path[:-len('.prof')] + '.txt', 'w') as summary:
+                stats = pstats.Stats(profile, stream=summary)
+                stats.sort_stats('cumulative').print_stats(40)
+        except (IOError, OSError) as e:
+            self._log("Profile could not be written to %s: %s" % (path, e))
+            return
+        self._log("Profile written to %s" % path)
@@ -0,0 +1,94 @@
+"""
+Grid Mixer and Launch Control - Render Scheduler
+Coalesces MIDI feedback - regions are marked dirty and rendered once per display tick
+"""
+
+
+class RenderScheduler:
+    """Collects dirty regions/cells and renders each one once per flush"""
+    
+    def __init__(self):
+        self._renderers = []  # (region, render_all, render_cell, render_done) in flush order
+        self._dirty_regions = set()
+        self._dirty_cells = {}  # region -> set of (row, col)
+        self.current_region = None  # Region being rendered during flush
+    
+    def register(self, region, render_all, render_cell=None, render_done=None):
+        """
+        Register render callbacks for a region - flush order follows registration order
+        render_done runs after the region rendered (e.g. to send a batched frame)
+        """
+        self._renderers.append((region, render_all, render_cell, render_done))
+    
+    def mark_dirty(self, region, cell=None):
+        """Mark a whole region, or a single (row, col) cell of it, for the next flush"""
+        if cell is None:
+            self._dirty_regions.add(region)
+        elif region not in self._dirty_regions:
+            self._dirty_cells.setdefault(region, set()).add(cell)
+    
+    def flush(self):
+        """Render everything marked dirty since the last flush"""
+        if not self._dirty_regions and not self._dirty_cells:
+            return
+        
+        # Swap out pending state first - renderers may mark new work for the next tick
+        dirty_regions = self._dirty_regions
+        dirty_cells = self._dirty_cells
+        self._dirty_regions = set()
+        self._dirty_cells = {}
+        
+        for region, render_all, render_cell, render_done in self._renderers:
+            self.current_region = region
+            if region in dirty_regions:
+                render_all()
+            elif region in dirty_cells:
+                for row, col in sorted(dirty_cells[region]):
+                    if render_cell is not None:
+                        render_cell(row, col)
+                    else:
+                        render_all()
+                        break
+            else:
+                continue
+            
+            if render_done is not None:
+                render_done()
+        self.current_region = None
+    
+    def clear(self):
+        """Drop all pending work"""
+        self._dirty_regions = set()
+        self._dirty_cells = {}
+
+
+class ProgressiveRefresh:
+    """Hands a list of (region, cell) render steps to mark_dirty spread over a number of ticks"""
+    
+    def __init__(self, mark_dirty):
+        self._mark_dirty = mark_dirty
+        self._steps = []
+        self._per_tick = 0
+    
+    @property
+    def running(self):
+        return bool(self._steps)
+    
+    def start(self, steps, ticks):
+        """Begin (or restart) a refresh - cell None marks the whole region"""
+        self._steps = list(steps)
+        self._per_tick = max(1, -(-len(self._steps) // max(1, ticks)))  # Ceiling division
+    
+    def step(self):
+        """Mark the next chunk dirty - True on the tick the last chunk goes out"""
+        if not self._steps:
+            return False
+        
+        chunk = self._steps[:self._per_tick]
+        del self._steps[:self._per_tick]
+        for region, cell in chunk:
+            self._mark_dirty(region, cell)
+        return not self._steps
+    
+    def cancel(self):
+        self._steps = []
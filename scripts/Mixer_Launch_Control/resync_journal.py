@@ -0,0 +1,99 @@
+"""
+Grid Mixer and Launch Control - Resync Journal
+Versioned change journal - a controller that reports its last-seen version
+gets only the cells changed since then
+"""
+import random
+from collections import deque
+
+from .constants import SYSEX_MANUFACTURER_ID, SYSEX_VERSION_STAMP, RESYNC_VERSION_BITS, RESYNC_EPOCH_BITS
+
+VERSION_MASK = (1 << RESYNC_VERSION_BITS) - 1
+VERSION_BYTES = (RESYNC_VERSION_BITS + 6) // 7
+EPOCH_BYTES = (RESYNC_EPOCH_BITS + 6) // 7
+
+
+def _encode(value, count):
+    """7-bit bytes, most significant first"""
+    return tuple((value >> (7 * i)) & 0x7F for i in reversed(range(count)))
+
+
+def _decode(data):
+    value = 0
+    for byte in data:
+        value = (value << 7) | (byte & 0x7F)
+    return value
+
+
+def encode_version(version):
+    """Wire form of a version"""
+    return _encode(version & VERSION_MASK, VERSION_BYTES)
+
+
+def encode_epoch(epoch):
+    return _encode(epoch, EPOCH_BYTES)
+
+
+def decode_stamp(payload):
+    """(epoch, wire version) from the payload of a stamp or resync request"""
+    return _decode(payload[:EPOCH_BYTES]), _decode(payload[EPOCH_BYTES:EPOCH_BYTES + VERSION_BYTES])
+
+
+def version_stamp(epoch, version):
+    """SysEx telling the controller everything up to version of this epoch has been sent"""
+    return (0xF0, SYSEX_MANUFACTURER_ID, SYSEX_VERSION_STAMP) + encode_epoch(epoch) + encode_version(version) + (0xF7,)
+
+
+class ResyncJournal:
+    """
+    Render steps (region, cell) recorded per state version - the version
+    advances once per display tick that rendered anything
+    """
+    
+    def __init__(self, size):
+        self.epoch = random.getrandbits(RESYNC_EPOCH_BITS)  # Tells this instance's versions from earlier ones
+        self.version = 0
+        self._entries = deque(maxlen=size)  # (version, region, cell), oldest first
+        self._pending = set()  # (region, cell) marked since the last commit
+        self._floor = 1  # Changes after this version are all still in the journal (0 = controller has nothing)
+    
+    def record(self, region, cell):
+        self._pending.add((region, cell))
+    
+    def commit(self):
+        """Close the tick - returns the new version, or None if nothing changed"""
+        if not self._pending:
+            return None
+        
+        self.version += 1
+        for region, cell in self._pending:
+            if len(self._entries) == self._entries.maxlen:
+                # Rolling over - controllers older than the dropped entry need a full dump
+                self._floor = self._entries[0][0]
+            self._entries.append((self.version, region, cell))
+        self._pending = set()
+        return self.version
+    
+    def expand(self, wire_version):
+        """Full version for a reported wire version (the most recent one it can stand for)"""
+        return self.version - ((self.version - wire_version) & VERSION_MASK)
+    
+    def changes_since(self, epoch, version):
+        """
+        (region, cell) steps changed after version - cell None is the whole
+        region. None if the version is from another epoch or the journal no
+        longer reaches back that far
+        """
+        if epoch != self.epoch or version < self._floor or version > self.version:
+            return None
+        
+        regions = set()
+        cells = set()
+        for entry_version, region, cell in reversed(self._entries):
+            if entry_version <= version:
+                break
+            if cell is None:
+                regions.add(region)
+            else:
+                cells.add((region, cell))
+        return [(region, None) for region in regions] + [entry for entry in cells if entry[0] not in regions]
@@ -0,0 +1,61 @@
+"""
+Grid Mixer and Launch Control - Song Snapshot
+Cached tracks/scenes/clip slots - rebuilt only when the song's track or scene list changes
+"""
+from .constants import GRID_COLS, LOOKAHEAD_TRACKS
+
+
+class SongSnapshot:
+    """Caches Live vectors so hot paths don't rebuild proxies on every access"""
+    
+    def __init__(self, parent):
+        self._parent = parent
+        self._tracks = None
+        self._scenes = None
+        self._clip_slots = {}  # track index -> clip slots, window (+ look-ahead) tracks only
+    
+    def invalidate(self):
+        """Drop everything - called from the song's tracks/scenes listeners"""
+        self._tracks = None
+        self._scenes = None
+        self._clip_slots = {}
+    
+    @property
+    def tracks(self):
+        if self._tracks is None:
+            self._tracks = tuple(self._parent.song().tracks)
+        return self._tracks
+    
+    @property
+    def scenes(self):
+        if self._scenes is None:
+            self._scenes = tuple(self._parent.song().scenes)
+        return self._scenes
+    
+    def track(self, track_idx):
+        """Track at index, or None if out of range"""
+        tracks = self.tracks
+        if 0 <= track_idx < len(tracks):
+            return tracks[track_idx]
+        return None
+    
+    def clip_slot(self, track_idx, scene_idx):
+        """Clip slot at track/scene, or None if out of range"""
+        slots = self._clip_slots.get(track_idx)
+        if slots is None:
+            track = self.track(track_idx)
+            if track is None:
+                return None
+            self._evict_clip_slots()
+            slots = self._clip_slots[track_idx] = tuple(track.clip_slots)
+        
+        if 0 <= scene_idx < len(slots):
+            return slots[scene_idx]
+        return None
+    
+    def _evict_clip_slots(self):
+        """Drop tracks that scrolled out of the window and its look-ahead (on each cache miss)"""
+        first = self._parent.track_offset - LOOKAHEAD_TRACKS
+        last = self._parent.track_offset + GRID_COLS + LOOKAHEAD_TRACKS
+        for track_idx in [idx for idx in self._clip_slots if not first <= idx < last]:
+            del self._clip_slots[track_idx]
@@ -0,0 +1,96 @@
+"""
+Grid Mixer and Launch Control - Traffic Stats
+Counts outgoing MIDI per component and cause, with a rolling messages/sec rate
+"""
+import time
+from collections import deque
+
+from .constants import RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL, CLIP_LAUNCH_CHANNEL, CAUSE_LISTENER
+
+
+def message_component(midi_bytes):
+    """Component that owns a message, from its address (navigation sends nothing itself)"""
+    status = midi_bytes[0]
+    if status == 0xF0:
+        return 'ColorManager'
+    channel = status & 0x0F
+    if channel in (RED_CHANNEL, GREEN_CHANNEL, BLUE_CHANNEL):
+        return 'ColorManager'
+    if channel == CLIP_LAUNCH_CHANNEL:
+        return 'ClipLauncher'
+    return 'MixerComponent'
+
+
+class TrafficStats:
+    """Message/byte counters keyed by (component, cause)"""
+    
+    def __init__(self, rate_window):
+        self.cause = CAUSE_LISTENER  # What the surface is currently handling
+        self._region_causes = {}  # region -> cause that last marked it dirty
+        self._counts = {}  # (component, cause) -> [messages, bytes]
+        self._rate_window = rate_window
+        self._window = deque()  # (time, messages) per display tick
+        self._window_messages = 0
+        self._tick_messages = 0
+        self.peak_rate = 0.0
+    
+    def mark_region(self, region):
+        """Remember why a region was dirtied - its render is counted under that cause"""
+        self._region_causes[region] = self.cause
+    
+    def cause_for(self, region=None):
+        """Cause a message is counted under - what dirtied the region being rendered, else the current one"""
+        if region is not None:
+            return self._region_causes.get(region, self.cause)
+        return self.cause
+    
+    def count(self, midi_bytes, cause=None):
+        """Count one message as it goes out (cause from cause_for when it was produced)"""
+        if not midi_bytes:
+            return
+        key = (message_component(midi_bytes), cause or self.cause)
+        entry = self._counts.get(key)
+        if entry is None:
+            entry = self._counts[key] = [0, 0]
+        entry[0] += 1
+        entry[1] += len(midi_bytes)
+        self._tick_messages += 1
+    
+    def tick(self, now=None):
+        """Close the current display tick and roll the rate window"""
+        if now is None:
+            now = time.time()
+        self._window.append((now, self._tick_messages))
+        self._window_messages += self._tick_messages
+        self._tick_messages = 0
+        while now - self._window[0][0] > self._rate_window:
+            self._window_messages -= self._window.popleft()[1]
+        rate = self.rate()
+        if rate > self.peak_rate:
+            self.peak_rate = rate
+    
+    def rate(self):
+        """Messages per second over the rolling window"""
+        return self._window_messages / float(self._rate_window)
+    
+    def totals(self, index):
+        """Totals grouped by component (index 0) or cause (index 1) -> {name: (messages, bytes)}"""
+        grouped = {}
+        for key, (messages, byte_count) in self._counts.items():
+            current = grouped.get(key[index], (0, 0))
+            grouped[key[index]] = (current[0] + messages, current[1] + byte_count)
+        return grouped
+    
+    def report(self):
+        """Human readable summary, one log line per entry"""
+        messages = sum(entry[0] for entry in self._counts.values())
+        byte_count = sum(entry[1] for entry in self._counts.values())
+        lines = ["MIDI traffic: %d msgs / %d bytes, %.1f msgs/s now, %.1f msgs/s peak"
+                 % (messages, byte_count, self.rate(), self.peak_rate)]
+        for title, index in (("component", 0), ("cause", 1)):
+            for name, (count, size) in sorted(self.totals(index).items(), key=lambda item: -item[1][0]):
+                lines.append("  %s %s: %d msgs / %d bytes" % (title, name, count, size))
+        for (component, cause), (count, size) in sorted(self._counts.items()):
+            lines.append("  %s/%s: %d msgs / %d bytes" % (component, cause, count, size))
+        return lines
+
@@ -0,0 +1,46 @@
+"""
+Grid Mixer and Launch Control - Value Scaling
+CC step <-> parameter value lookup tables for volume, pan and sends, built once
+at import and shared by feedback and input handling
+"""
+from bisect import bisect_right
+
+from .constants import VOLUME_UNITY_VALUE, VOLUME_UNITY_STEP, PAN_CENTER_STEP
+
+STEPS = 128
+
+
+class ValueTable:
+    """
+    Piecewise linear from (0, minimum) through the detent to (127, maximum) -
+    every step keeps within half a step of Live's linear CC mapping, so a
+    value Live set from a CC converts back to that same CC
+    """
+    
+    def __init__(self, minimum, maximum, detent_step=None, detent_value=None):
+        if detent_step is None:
+            detent_step, detent_value = STEPS - 1, maximum
+        
+        values = []
+        for step in range(STEPS):
+            if step <= detent_step:
+                values.append(minimum + (detent_value - minimum) * step / float(detent_step))
+            else:
+                values.append(detent_value + (maximum - detent_value) * (step - detent_step)
+                              / float(STEPS - 1 - detent_step))
+        self._values = tuple(values)  # step -> parameter value
+        # Midpoints between neighbouring steps - the value -> step direction is a bisect
+        self._bounds = tuple((values[i] + values[i + 1]) / 2.0 for i in range(STEPS - 1))
+    
+    def value(self, step):
+        """Parameter value for a CC step"""
+        return self._values[step]
+    
+    def step(self, value):
+        """Nearest CC step for a parameter value (clamped to 0..127)"""
+        return bisect_right(self._bounds, value)
+
+
+VOLUME_TABLE = ValueTable(0.0, 1.0, VOLUME_UNITY_STEP, VOLUME_UNITY_VALUE)
+PAN_TABLE = ValueTable(-1.0, 1.0, PAN_CENTER_STEP, 0.0)
+SEND_TABLE = ValueTable(0.0, 1.0)
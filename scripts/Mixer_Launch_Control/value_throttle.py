@@ -0,0 +1,61 @@
+"""
+Grid Mixer and Launch Control - Value Throttle
+Per-control rate limit for continuous feedback - minimum interval and minimum
+delta, with a trailing-edge send so the final value always arrives
+"""
+
+
+class ValueThrottle:
+    """
+    Last sent (time, value) per key plus the value held for the next flush -
+    changes only ever leave from flush(), once per display tick
+    """
+    
+    def __init__(self, send, min_interval, min_delta):
+        self._send = send  # send(key, value)
+        self._min_interval = min_interval
+        self._min_delta = min_delta
+        self._sent = {}  # key -> (time, value) last sent
+        self._pending = {}  # key -> (value, time of the latest change) held back
+    
+    def update(self, key, value, now):
+        """New value for key - held until flush() decides it may go out"""
+        last = self._sent.get(key)
+        if last is not None and value == last[1]:
+            self._pending.pop(key, None)  # Back where the controller already is
+        else:
+            self._pending[key] = (value, now)
+    
+    def flush(self, now):
+        """
+        Send held values whose interval has passed and that moved far enough -
+        smaller moves go out on the trailing edge, once the value has been still
+        for an interval
+        """
+        for key, (value, changed) in list(self._pending.items()):
+            last = self._sent.get(key)
+            if last is not None:
+                last_time, last_value = last
+                if now - last_time < self._min_interval:
+                    continue
+                if abs(value - last_value) < self._min_delta and now - changed < self._min_interval:
+                    continue
+            self._emit(key, value, now)
+    
+    def sent(self, key, value, now):
+        """Record a value the controller already shows (full refresh, its own input)"""
+        self._sent[key] = (now, value)
+        self._pending.pop(key, None)
+    
+    def drop_pending(self):
+        """Forget held values - their controls were re-bound and get redrawn in full"""
+        self._pending = {}
+    
+    def clear(self):
+        self._sent = {}
+        self._pending = {}
+    
+    def _emit(self, key, value, now):
+        del self._pending[key]
+        self._sent[key] = (now, value)
+        self._send(key, value)
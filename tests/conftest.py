@@ -0,0 +1,35 @@
+"""
+Shared fixtures - the scripts run headlessly against the fake Live/_Framework
+in tools/live_harness (GRID_SCRIPTS_DIR selects another scripts/ folder)
+"""
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+import live_harness  # noqa: E402
+
+
+@pytest.fixture
+def harness():
+    """Factory for set-up Harness instances - disconnected after the test"""
+    made = []
+
+    def make(variant='Mixer_Launch_Control', **song_args):
+        h = live_harness.Harness(variant, **song_args)
+        made.append(h)
+        return h
+
+    yield make
+    for h in made:
+        h.disconnect()
+
+
+@pytest.fixture
+def script_module():
+    """Import a Mixer_Launch_Control submodule the way the harness loads the package"""
+    package = live_harness.load_variant('Mixer_Launch_Control')
+    return lambda name: importlib.import_module(package.__name__ + '.' + name)
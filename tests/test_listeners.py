@@ -0,0 +1,83 @@
+"""
+Listener bookkeeping - one listener per (object, property), bounded by the visible window
+"""
+from Live import listener_stats, make_song
+
+
+def _mute_listeners(song):
+    return [track.listener_count('mute') for track in song._tracks]
+
+
+def test_mixer_listeners_follow_the_window(harness):
+    # Every fifth track (index 4, 9, 14) can't be armed
+    h = harness(num_tracks=16, num_scenes=8)
+    mixer = h.surface._mixer_component
+    assert mixer.listener_count() == 23
+    assert _mute_listeners(h.song) == [1] * 8 + [0] * 8
+
+    h.note(0, 45)  # One track right
+    assert h.surface.track_offset == 1
+    assert mixer.listener_count() == 23
+    assert _mute_listeners(h.song) == [0] + [1] * 8 + [0] * 7
+
+    h.note(0, 61)  # One bank right - only 7 tracks left in the window
+    assert h.surface.track_offset == 9
+    assert mixer.listener_count() == 19
+    assert _mute_listeners(h.song) == [0] * 9 + [1] * 7
+
+
+def test_track_step_rebinds_only_the_edges(harness):
+    h = harness(num_tracks=16, num_scenes=8, clip_density=1.0)
+    before = listener_stats()
+    h.note(0, 45)
+    after = listener_stats()
+    # Mixer: track 0 out (mute/solo/arm), track 8 in. Clip grid: one column of 4 slots
+    # (has_clip) and their clips (playing, color) each way
+    assert after['removed'] - before['removed'] == 3 + 4 + 4 * 2
+    assert after['added'] - before['added'] == 3 + 4 + 4 * 2
+
+
+def test_disconnect_removes_every_listener(harness):
+    h = harness(num_tracks=16, num_scenes=8)
+    h.disconnect()
+    assert _mute_listeners(h.song) == [0] * 16
+    assert all(track.listener_count() == 0 for track in h.song._tracks)
+
+
+def test_registry_sync_adds_and_removes_the_difference(script_module):
+    registry = script_module('listener_registry').ListenerRegistry()
+    tracks = make_song(num_tracks=3)._tracks
+    calls = []
+    callback = lambda: calls.append(1)
+
+    registry.sync([(tracks[0], 'mute', callback), (tracks[1], 'mute', callback)])
+    assert registry.count() == 2
+    assert _mute_listeners(tracks[0].canonical_parent) == [1, 1, 0]
+
+    before = listener_stats()
+    registry.sync([(tracks[0], 'mute', callback), (tracks[1], 'mute', callback)])
+    assert listener_stats() == before  # Nothing to do
+
+    registry.sync([(tracks[1], 'mute', callback), (tracks[2], 'solo', callback)])
+    after = listener_stats()
+    assert (after['added'] - before['added'], after['removed'] - before['removed']) == (1, 1)
+    assert _mute_listeners(tracks[0].canonical_parent) == [0, 1, 0]
+    assert tracks[2].listener_count('solo') == 1
+
+    tracks[1].mute = True
+    tracks[2].solo = True
+    assert len(calls) == 2
+
+    registry.clear()
+    assert registry.count() == 0
+    assert sum(track.listener_count() for track in tracks) == 0
+
+
+def test_registry_add_keeps_one_listener_per_property(script_module):
+    registry = script_module('listener_registry').ListenerRegistry()
+    track = make_song(num_tracks=1)._tracks[0]
+    assert registry.add(track, 'mute', lambda: None)
+    assert not registry.add(track, 'mute', lambda: None)
+    assert track.listener_count('mute') == 1
+    registry.remove(track, 'mute')
+    assert track.listener_count('mute') == 0
@@ -0,0 +1,90 @@
+"""
+OutputLimiter and MidiOutputBuffer - priority order, in-place replacement, the per-flush budget and status grouping
+"""
+import pytest
+
+CLIP_LED = (0x94, 60, 127)
+MIX_LED = (0x90, 32, 127)
+FADER = (0xB0, 44, 100)
+COLOR = (0xB1, 60, 20)
+
+
+@pytest.fixture
+def limiter(script_module):
+    def make(budget):
+        sent = []
+        limiter = script_module('midi_output').OutputLimiter(lambda message, tag: sent.append((message, tag)),
+                                                              budget)
+        limiter.sent = sent
+        return limiter
+    return make
+
+
+def test_flush_sends_in_priority_order(limiter):
+    out = limiter(100)
+    for message in (COLOR, FADER, MIX_LED, CLIP_LED):
+        out.add(message, 'cause')
+    out.flush()
+    assert [message for message, tag in out.sent] == [CLIP_LED, MIX_LED, FADER, COLOR]
+    assert out.pending() == 0
+
+
+def test_same_priority_keeps_arrival_order(limiter):
+    out = limiter(100)
+    out.add((0x94, 62, 127))
+    out.add((0x94, 60, 127))
+    out.add((0x94, 61, 127))
+    out.flush()
+    assert [message[1] for message, tag in out.sent] == [62, 60, 61]
+
+
+def test_newer_value_replaces_in_place_with_its_tag(limiter):
+    out = limiter(100)
+    out.add((0x94, 60, 127), 'listener')
+    out.add((0x94, 61, 127), 'listener')
+    out.add((0x84, 60, 0), 'navigation')  # Note off addresses the same LED
+    out.flush()
+    assert out.sent == [((0x84, 60, 0), 'navigation'), ((0x94, 61, 127), 'listener')]
+
+
+def test_budget_spreads_output_over_flushes(limiter):
+    out = limiter(2)
+    out.add(COLOR)
+    for note in (60, 61, 62):
+        out.add((0x94, note, 127))
+    out.flush()
+    assert [message[1] for message, tag in out.sent] == [60, 61]
+    assert out.pending() == 2
+    out.flush()
+    assert [message[1] for message, tag in out.sent] == [60, 61, 62, 60]
+    assert out.sent[-1][0] == COLOR
+    assert out.pending() == 0
+
+
+def test_oversized_sysex_goes_out_alone(limiter):
+    out = limiter(2)
+    frame = (0xF0,) + (0,) * 10 + (0xF7,)  # Costs 4 units
+    out.add(CLIP_LED)
+    out.add(frame)
+    out.flush()
+    assert [message for message, tag in out.sent] == [CLIP_LED]
+    out.flush()
+    assert [message for message, tag in out.sent] == [CLIP_LED, frame]
+
+
+def test_output_buffer_sends_single_messages_grouped_by_status(script_module):
+    sent = []
+    output = script_module('midi_output').MidiOutputBuffer(sent.append)
+    for message in ((0xB1, 60, 1), (0x94, 60, 127), (0xB1, 61, 2), (0x94, 60, 0)):
+        assert output.add(message)
+    assert sent == []
+    output.flush()
+    assert sent == [(0x94, 60, 127), (0x94, 60, 0), (0xB1, 60, 1), (0xB1, 61, 2)]
+
+
+def test_output_buffer_keeps_sysex_behind_queued_messages(script_module):
+    sent = []
+    output = script_module('midi_output').MidiOutputBuffer(sent.append)
+    output.add((0x94, 60, 127))
+    assert not output.add((0xF0, 0x7D, 1, 0xF7))  # Caller sends SysEx itself, after the flush
+    assert sent == [(0x94, 60, 127)]
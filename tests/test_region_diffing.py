@@ -0,0 +1,90 @@
+"""
+Only what changed goes out - per cell, per color channel, once per display tick
+"""
+from collections import Counter
+
+NOTE_CLIP = 0x94  # Note on, CLIP_LAUNCH_CHANNEL
+NOTE_MAIN = 0x90
+CC_MAIN = 0xB0
+CC_RED, CC_GREEN, CC_BLUE = 0xB1, 0xB2, 0xB3
+
+
+def _full_grid(harness):
+    return harness(num_tracks=16, num_scenes=8, clip_density=1.0)
+
+
+def test_idle_tick_sends_nothing(harness):
+    h = _full_grid(harness)
+    assert h.capture(h.tick) == []
+
+
+def test_full_state_trigger_sends_every_region_once(harness):
+    h = _full_grid(harness)
+    sent = Counter(message[0] for message in h.capture(h.cc, 0, 127, 127))
+    assert sent == {NOTE_CLIP: 32, CC_RED: 32, CC_GREEN: 32, CC_BLUE: 32, NOTE_MAIN: 24, CC_MAIN: 32}
+
+
+def test_clip_fire_sends_only_its_cell(harness):
+    h = _full_grid(harness)
+    slot = h.song.tracks[1].clip_slots[2]
+    assert h.capture(slot.fire) == [(NOTE_CLIP, 69, 127)]
+    assert h.capture(slot.fire) == []  # Already playing
+
+
+def test_color_change_sends_only_changed_channels(harness):
+    h = _full_grid(harness)
+    clip = h.song.tracks[1].clip_slots[2].clip
+    assert h.capture(setattr, clip, 'color', 0x004000) == [(CC_RED, 69, 0), (CC_GREEN, 69, 64), (CC_BLUE, 69, 0)]
+    assert h.capture(setattr, clip, 'color', 0x004000) == []
+    assert h.capture(setattr, clip, 'color', 0x104000) == [(CC_RED, 69, 16)]
+
+
+def test_changes_within_a_tick_coalesce(harness):
+    h = _full_grid(harness)
+    clip = h.song.tracks[0].clip_slots[0].clip
+
+    def recolor_twice():
+        clip.color = 0x000010
+        clip.color = 0x000020
+
+    assert h.capture(recolor_twice) == [(CC_RED, 60, 0), (CC_GREEN, 60, 0), (CC_BLUE, 60, 0x20)]
+
+
+def test_mute_sends_only_its_strip_led(harness):
+    h = _full_grid(harness)
+    assert h.capture(setattr, h.song.tracks[2], 'mute', True) == [(NOTE_MAIN, 34, 127)]
+    assert h.capture(setattr, h.song.tracks[12], 'mute', True) == []  # Off screen
+
+
+def test_mix_button_press_sends_its_led_once(harness):
+    h = _full_grid(harness)
+    assert h.capture(h.note, 0, 32) == [(NOTE_MAIN, 32, 127)]  # Mute, strip 0
+    assert h.capture(h.note, 0, 36) == [(NOTE_MAIN, 36, 127)]  # Solo, strip 0
+    assert h.capture(h.note, 0, 37) == [(NOTE_MAIN, 36, 0), (NOTE_MAIN, 37, 127)]  # Exclusive solo moves
+
+
+def test_track_step_skips_unchanged_clip_leds(harness):
+    h = _full_grid(harness)
+    h.capture(h.cc, 0, 127, 127)  # The controller asks for the full state when it connects
+    # Every cell holds a stopped clip before and after the step - only colors, mix LEDs and faders change
+    sent = Counter(message[0] for message in h.capture(h.note, 0, 45))
+    assert NOTE_CLIP not in sent
+    assert sent == {CC_RED: 32, CC_GREEN: 32, CC_BLUE: 32, NOTE_MAIN: 24, CC_MAIN: 32}
+
+
+def test_render_scheduler_renders_each_region_once(script_module):
+    scheduler = script_module('render_scheduler').RenderScheduler()
+    rendered = []
+    scheduler.register('a', lambda: rendered.append('a'), lambda row, col: rendered.append(('a', row, col)))
+    scheduler.register('b', lambda: rendered.append('b'), lambda row, col: rendered.append(('b', row, col)))
+
+    scheduler.mark_dirty('a', (1, 0))
+    scheduler.mark_dirty('a', (0, 3))
+    scheduler.mark_dirty('a', (1, 0))
+    scheduler.mark_dirty('b', (0, 0))
+    scheduler.mark_dirty('b')  # Whole region supersedes its cells
+    scheduler.flush()
+    assert rendered == [('a', 0, 3), ('a', 1, 0), 'b']
+
+    scheduler.flush()
+    assert rendered == [('a', 0, 3), ('a', 1, 0), 'b']
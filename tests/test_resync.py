@@ -0,0 +1,92 @@
+"""
+Incremental resync - version stamps, journal replay and full dumps for versions
+the surface can't vouch for
+"""
+import time
+from collections import Counter
+
+import pytest
+
+RESYNC = {'RESYNC_PROTOCOL': True}
+STAMP = (0xF0, 0x7D, 0x02)
+NOTE_CLIP = 0x94
+NOTE_MAIN = 0x90
+CC_MAIN = 0xB0
+
+
+def _ours(messages):
+    """Everything but the native fader values, which Live resends on every resync"""
+    return [message for message in messages if message[:3] != STAMP and message[0] != CC_MAIN]
+
+
+@pytest.fixture
+def resync_module(script_module):
+    return script_module('resync_journal')
+
+
+def _last_stamp(messages, resync_module):
+    stamps = [message for message in messages if message[:3] == STAMP]
+    assert stamps, 'no version stamp sent'
+    return resync_module.decode_stamp(stamps[-1][3:-1])
+
+
+def _request(resync_module, epoch, version):
+    return ((0xF0, 0x7D, 0x03) + resync_module.encode_epoch(epoch)
+            + resync_module.encode_version(version) + (0xF7,))
+
+
+def test_resync_replays_only_missed_cells(harness, resync_module):
+    h = harness(num_tracks=16, num_scenes=8, clip_density=1.0, constants=RESYNC)
+    epoch, version = _last_stamp(h.capture(h.cc, 0, 127, 127), resync_module)
+    h.capture(setattr, h.song.tracks[2], 'mute', True)  # Lost on the way
+
+    sent = h.capture(h.surface.receive_midi, _request(resync_module, epoch, version))
+    assert _ours(sent) == [(NOTE_MAIN, 34, 127)]
+    assert Counter(message[0] for message in sent)[CC_MAIN] == 32
+    assert _last_stamp(sent, resync_module) == (epoch, version + 2)
+
+
+def test_current_controller_gets_only_a_stamp(harness, resync_module):
+    h = harness(num_tracks=16, num_scenes=8, clip_density=1.0, constants=RESYNC)
+    epoch, version = _last_stamp(h.capture(h.cc, 0, 127, 127), resync_module)
+    sent = h.capture(h.surface.receive_midi, _request(resync_module, epoch, version))
+    assert _ours(sent) == []
+    assert [message for message in sent if message[:3] == STAMP] == [
+        STAMP + resync_module.encode_epoch(epoch) + resync_module.encode_version(version) + (0xF7,)]
+
+
+def test_version_from_another_instance_gets_full_state(harness, resync_module):
+    first = harness(num_tracks=16, num_scenes=8, clip_density=1.0, constants=RESYNC)
+    old_epoch, old_version = _last_stamp(first.capture(first.cc, 0, 127, 127), resync_module)
+    first.disconnect()
+
+    # Script reloaded on the same set - the new instance counts past the old version
+    second = harness(song=first.song, constants=RESYNC)
+    if second.surface._journal.epoch == old_epoch:
+        second.surface._journal.epoch ^= 1  # Random epochs collide once in 16384 runs
+    second.capture(second.cc, 0, 127, 127)
+    for track in second.song.tracks[:4]:
+        second.capture(setattr, track, 'mute', True)
+    second.capture(second.song.tracks[1].clip_slots[0].fire)
+    assert second.surface._journal.version > old_version
+
+    sent = second.capture(second.surface.receive_midi, _request(resync_module, old_epoch, old_version))
+    assert Counter(message[0] for message in sent)[NOTE_CLIP] == 32
+    assert Counter(message[0] for message in sent)[NOTE_MAIN] == 24
+    assert _last_stamp(sent, resync_module)[0] == second.surface._journal.epoch
+
+
+def test_resync_replays_throttled_fader_output(harness, resync_module):
+    h = harness(num_tracks=16, num_scenes=8, clip_density=1.0,
+                constants=dict(RESYNC, NATIVE_FADER_FEEDBACK=False))
+    epoch, version = _last_stamp(h.capture(h.cc, 0, 127, 127), resync_module)
+
+    time.sleep(0.06)  # Past FADER_FEEDBACK_INTERVAL since the full state
+    volume = h.song.tracks[0].mixer_device.volume
+    volume.value = 0.2
+    lost = h.capture(h.tick)  # Throttle sends it - and it gets lost on the way
+    assert [message for message in lost if message[:3] != STAMP] == [(CC_MAIN, 44, 25)]
+
+    sent = h.capture(h.surface.receive_midi, _request(resync_module, epoch, version))
+    assert (CC_MAIN, 44, 25) in sent
+    assert _last_stamp(sent, resync_module)[1] > version
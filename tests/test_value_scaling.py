@@ -0,0 +1,44 @@
+"""
+ValueTable - CC step <-> parameter value round trip for volume, pan and sends
+"""
+import pytest
+
+TABLES = ('VOLUME_TABLE', 'PAN_TABLE', 'SEND_TABLE')
+RANGES = {'VOLUME_TABLE': (0.0, 1.0), 'PAN_TABLE': (-1.0, 1.0), 'SEND_TABLE': (0.0, 1.0)}
+
+
+@pytest.fixture
+def value_scaling(script_module):
+    return script_module('value_scaling')
+
+
+@pytest.mark.parametrize('name', TABLES)
+def test_every_step_round_trips(value_scaling, name):
+    table = getattr(value_scaling, name)
+    assert [table.step(table.value(step)) for step in range(128)] == list(range(128))
+
+
+@pytest.mark.parametrize('name', TABLES)
+def test_live_linear_cc_values_map_back_to_their_step(value_scaling, name):
+    table = getattr(value_scaling, name)
+    minimum, maximum = RANGES[name]
+    linear = [minimum + (maximum - minimum) * step / 127.0 for step in range(128)]
+    assert [table.step(value) for value in linear] == list(range(128))
+
+
+@pytest.mark.parametrize('name', TABLES)
+def test_out_of_range_values_clamp(value_scaling, name):
+    table = getattr(value_scaling, name)
+    minimum, maximum = RANGES[name]
+    assert table.value(0) == minimum
+    assert table.value(127) == maximum
+    assert table.step(minimum - 1.0) == 0
+    assert table.step(maximum + 1.0) == 127
+
+
+def test_detents_are_exact(value_scaling, script_module):
+    constants = script_module('constants')
+    assert value_scaling.VOLUME_TABLE.value(constants.VOLUME_UNITY_STEP) == constants.VOLUME_UNITY_VALUE
+    assert value_scaling.VOLUME_TABLE.step(constants.VOLUME_UNITY_VALUE) == constants.VOLUME_UNITY_STEP
+    assert value_scaling.PAN_TABLE.value(constants.PAN_CENTER_STEP) == 0.0
+    assert value_scaling.PAN_TABLE.step(0.0) == constants.PAN_CENTER_STEP
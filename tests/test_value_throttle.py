@@ -0,0 +1,83 @@
+"""
+ValueThrottle - minimum interval and delta, trailing edge for small moves
+"""
+import pytest
+
+INTERVAL = 0.05
+DELTA = 2
+
+
+@pytest.fixture
+def throttle(script_module):
+    sent = []
+    throttle = script_module('value_throttle').ValueThrottle(
+        lambda key, value: sent.append((key, value)), INTERVAL, DELTA)
+    throttle.sent_values = sent
+    return throttle
+
+
+def test_first_value_goes_out_on_flush(throttle):
+    throttle.update('vol', 10, 0.0)
+    assert throttle.sent_values == []  # Only flush sends
+    throttle.flush(0.0)
+    assert throttle.sent_values == [('vol', 10)]
+
+
+def test_values_within_the_interval_collapse_to_the_last(throttle):
+    throttle.update('vol', 10, 0.0)
+    throttle.flush(0.0)
+    for step, now in enumerate((0.01, 0.02, 0.03)):
+        throttle.update('vol', 20 + step, now)
+        throttle.flush(now)
+    assert throttle.sent_values == [('vol', 10)]
+    throttle.flush(0.05)
+    assert throttle.sent_values == [('vol', 10), ('vol', 22)]
+
+
+def test_small_move_waits_for_the_trailing_edge(throttle):
+    throttle.update('vol', 10, 0.0)
+    throttle.flush(0.0)
+    throttle.update('vol', 11, 1.0)
+    throttle.flush(1.0)
+    throttle.flush(1.04)
+    assert throttle.sent_values == [('vol', 10)]
+    throttle.flush(1.05)  # Still for a whole interval
+    assert throttle.sent_values == [('vol', 10), ('vol', 11)]
+
+
+def test_return_to_the_shown_value_drops_the_pending_one(throttle):
+    throttle.update('vol', 10, 0.0)
+    throttle.flush(0.0)
+    throttle.update('vol', 40, 0.01)
+    throttle.update('vol', 10, 0.02)
+    throttle.flush(1.0)
+    assert throttle.sent_values == [('vol', 10)]
+
+
+def test_sent_records_what_the_controller_shows(throttle):
+    throttle.update('vol', 40, 0.0)
+    throttle.sent('vol', 40, 0.0)  # e.g. the fader's own input
+    throttle.flush(1.0)
+    assert throttle.sent_values == []
+
+
+def test_keys_are_independent(throttle):
+    throttle.update('vol', 10, 0.0)
+    throttle.update('pan', 64, 0.0)
+    throttle.flush(0.0)
+    throttle.update('vol', 30, 0.01)
+    throttle.update('send', 5, 0.01)
+    throttle.flush(0.01)
+    assert throttle.sent_values == [('vol', 10), ('pan', 64), ('send', 5)]
+
+
+def test_drop_pending_keeps_what_was_sent(throttle):
+    throttle.update('vol', 10, 0.0)
+    throttle.flush(0.0)
+    throttle.update('vol', 40, 0.01)
+    throttle.drop_pending()  # The control now shows another track
+    throttle.flush(1.0)
+    assert throttle.sent_values == [('vol', 10)]
+    throttle.update('vol', 11, 2.0)  # Still measured against the last sent value
+    throttle.flush(2.0)
+    assert throttle.sent_values == [('vol', 10)]
@@ -0,0 +1,251 @@
+"""
+Scalability benchmarks for the Grid remote scripts
+Runs every script variant headlessly against simulated songs of growing size
+and writes wall time, MIDI traffic and listener churn per scenario as JSON.
+
+    cd tools
+    python benchmarks.py                                  # default sizes, all variants
+    python benchmarks.py --sizes 8x4,1000x500 --repeat 3 --output before.json
+    python benchmarks.py --sizes 8x4,1000x500 --repeat 3 --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from live_harness import Harness, SCRIPTS_DIR, VARIANTS, split_messages
+from Live import listener_stats, make_song
+
+DEFAULT_SIZES = '8x4,100x32,300x100,1000x500'
+
+
+def _registered_listeners(song):
+    """Listeners currently attached anywhere in the song"""
+    total = 0
+    for track in song._tracks:
+        total += track.listener_count()
+        for param in (track.mixer_device.volume, track.mixer_device.panning) + track.mixer_device.sends:
+            total += param.listener_count()
+        for slot in track._clip_slots:
+            total += slot.listener_count()
+            if slot.clip is not None:
+                total += slot.clip.listener_count()
+    for scene in song._scenes:
+        total += scene.listener_count()
+    return total + song.listener_count() + song.view.listener_count()
+
+
+def _scenarios(h):
+    """(name, action) pairs - each action leaves the song the size it found it"""
+    song = h.song
+    surface = h.surface
+    toggle = {'track': 0, 'scene': 0, 'launch': 0, 'fader': 0, 'mute': 0}
+
+    def track_step():
+        # Alternate right/left so the offset never runs into the end of the set
+        toggle['track'] ^= 1
+        h.note(0, 45 if toggle['track'] else 44)
+
+    def scene_step():
+        toggle['scene'] ^= 1
+        h.note(0, 47 if toggle['scene'] else 46)
+
+    def bank_step():
+        toggle['track'] ^= 1
+        h.note(0, 61 if toggle['track'] else 60)
+
+    def add_delete_track():
+        song.create_track(surface.track_offset)
+        song.delete_track(surface.track_offset)
+
+    def add_delete_scene():
+        song.create_scene(surface.scene_offset)
+        song.delete_scene(surface.scene_offset)
+
+    def fader_move():
+        toggle['fader'] ^= 1
+        h.cc(0, 44, 100 if toggle['fader'] else 64)  # First volume fader
+
+    def listener_setup():
+        # Cold registration - the registry is emptied so every mixer listener is attached again
+        surface._mixer_component.disconnect()
+        surface._mixer_component.setup_track_listeners()
+
+    def mute_all():
+        # Song side, like a group mute in Live - callbacks shows how many listeners react
+        toggle['mute'] ^= 1
+        for track in song.tracks:
+            track.mute = bool(toggle['mute'])
+
+    def scene_launch():
+        # Every clip in a visible scene starts, the ones in the other scene stop
+        toggle['launch'] ^= 1
+        scenes = song.scenes
+        idx = min(surface.scene_offset + toggle['launch'], len(scenes) - 1)
+        scenes[idx].fire()
+
+    return (
+        ('track_step', track_step),
+        ('scene_step', scene_step),
+        ('bank_step', bank_step),
+        ('tracks_changed', add_delete_track),
+        ('scenes_changed', add_delete_scene),
+        ('full_state_trigger', lambda: h.cc(0, 127, 127)),
+        ('mute_button', lambda: h.note(0, 32)),  # First strip - toggles, so repeats stay balanced
+        ('clip_launch', lambda: h.note(4, 60)),  # Top left clip cell
+        ('fader_move', fader_move),
+        ('listener_setup', listener_setup),
+        ('mute_all', mute_all),
+        ('scene_launch', scene_launch),
+    )
+
+
+def _measure(h, action, repeat):
+    """Run action repeat times (ticking until its output is out) - returns timing and traffic of the runs"""
+    times = []
+    messages = 0
+    byte_count = 0
+    before = listener_stats()
+    accesses = h.song.track_access_count
+    for _ in range(repeat):
+        h.reset()
+        start = time.perf_counter()
+        action()
+        h.drain()
+        times.append(time.perf_counter() - start)
+        sent = h.reset()
+        messages += len(split_messages(sent))
+        byte_count += sum(len(data) for data in sent)
+    after = listener_stats()
+    times.sort()
+    return {
+        'wall_us_median': round(times[len(times) // 2] * 1e6, 1),
+        'wall_us_min': round(times[0] * 1e6, 1),
+        'messages': messages / float(repeat),
+        'bytes': byte_count / float(repeat),
+        'listener_churn': (after['added'] - before['added'] + after['removed'] - before['removed']) / float(repeat),
+        'callbacks': (after['notified'] - before['notified']) / float(repeat),
+        'track_accesses': (h.song.track_access_count - accesses) / float(repeat),
+    }
+
+
+def _measure_setup(variant, song):
+    """Time _delayed_setup on its own (the scheduled call is run directly)"""
+    h = Harness(variant, song=song, setup=False)
+    h.surface._scheduled = []
+    h.reset()
+    before = listener_stats()
+    accesses = song.track_access_count
+    start = time.perf_counter()
+    h.surface._delayed_setup()
+    h.drain()
+    elapsed = time.perf_counter() - start
+    after = listener_stats()
+    sent = h.reset()
+    result = {
+        'wall_us_median': round(elapsed * 1e6, 1),
+        'wall_us_min': round(elapsed * 1e6, 1),
+        'messages': float(len(split_messages(sent))),
+        'bytes': float(sum(len(data) for data in sent)),
+        'listener_churn': float(after['added'] - before['added'] + after['removed'] - before['removed']),
+        'callbacks': float(after['notified'] - before['notified']),
+        'track_accesses': float(song.track_access_count - accesses),
+    }
+    return h, result
+
+
+def run(variants, sizes, repeat, clip_density):
+    results = []
+    for num_tracks, num_scenes in sizes:
+        for variant in variants:
+            song = make_song(num_tracks, num_scenes, clip_density)
+            h, setup = _measure_setup(variant, song)
+            rows = [('delayed_setup', setup)]
+            for name, action in _scenarios(h):
+                rows.append((name, _measure(h, action, repeat)))
+            listeners = _registered_listeners(song)
+            h.disconnect()
+
+            for name, row in rows:
+                row.update({'variant': variant, 'tracks': num_tracks, 'scenes': num_scenes,
+                            'scenario': name, 'registered_listeners': listeners})
+                results.append(row)
+                print('%-22s %5dx%-4d %-18s %10.1f us %8.1f msgs %8.1f churn %8.1f callbacks' % (
+                    variant, num_tracks, num_scenes, name, row['wall_us_median'],
+                    row['messages'], row['listener_churn'], row['callbacks']))
+    return results
+
+
+def compare(results, path):
+    """Print median wall time, song().tracks accesses and callbacks per event next to an earlier results file"""
+    with open(path) as f:
+        baseline = json.load(f)
+    before = dict(((row['variant'], row['tracks'], row['scenes'], row['scenario']), row)
+                  for row in baseline['results'])
+    print('Compared with %s (revision %s)' % (path, baseline['meta'].get('revision')))
+    for row in results:
+        old = before.get((row['variant'], row['tracks'], row['scenes'], row['scenario']))
+        if old is None:
+            continue
+        print('%-22s %5dx%-4d %-18s %10.1f -> %10.1f us %6.1f -> %6.1f song().tracks %8.1f -> %8.1f callbacks' % (
+            row['variant'], row['tracks'], row['scenes'], row['scenario'],
+            old['wall_us_median'], row['wall_us_median'],
+            old.get('track_accesses', float('nan')), row['track_accesses'],
+            old['callbacks'], row['callbacks']))
+
+
+def _git_revision():
+    """Revision of the scripts being measured (GRID_SCRIPTS_DIR may point at another checkout)"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=SCRIPTS_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def _parse_sizes(text):
+    sizes = []
+    for item in text.split(','):
+        tracks, scenes = item.lower().split('x')
+        sizes.append((int(tracks), int(scenes)))
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--variants', default=','.join(VARIANTS),
+                        help='comma separated scripts/ folders (default: all)')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help='comma separated TRACKSxSCENES (default: %s)' % DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5, help='runs per scenario (default: 5)')
+    parser.add_argument('--clip-density', type=float, default=0.5,
+                        help='share of clip slots holding a clip (default: 0.5)')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON results file')
+    parser.add_argument('--compare', help='earlier JSON results file to print before/after against')
+    args = parser.parse_args(argv)
+
+    results = run(args.variants.split(','), _parse_sizes(args.sizes), args.repeat, args.clip_density)
+    report = {
+        'meta': {
+            'revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': args.repeat,
+            'clip_density': args.clip_density,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print('Wrote %d results to %s' % (len(results), args.output))
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
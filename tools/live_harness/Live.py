@@ -0,0 +1,326 @@
+"""
+Fake Live object model
+Pure-Python stand-ins for the parts of the Live API used by the scripts
+"""
+
+
+class _Listenable(object):
+    """Mixin providing Live-style add_x_listener / remove_x_listener / x_has_listener"""
+
+    _listenable = ()
+    # Song-wide accounting for benchmarks: listeners attached/detached and callbacks run
+    stats = {'added': 0, 'removed': 0, 'notified': 0}
+
+    def __init__(self):
+        self._listeners = dict((name, []) for name in self._listenable)
+
+    def __getattr__(self, attr):
+        # __getattr__ only runs for missing attributes, so real fields win
+        for prefix, suffix, action in (('add_', '_listener', self._add),
+                                       ('remove_', '_listener', self._remove),
+                                       ('', '_has_listener', self._has)):
+            if attr.startswith(prefix) and attr.endswith(suffix):
+                name = attr[len(prefix):-len(suffix)]
+                if name in self._listenable:
+                    return lambda cb, _name=name, _action=action: _action(_name, cb)
+        raise AttributeError(attr)
+
+    def _add(self, name, cb):
+        if cb in self._listeners[name]:
+            raise RuntimeError('Listener already connected: %s' % name)
+        self._listeners[name].append(cb)
+        _Listenable.stats['added'] += 1
+
+    def _remove(self, name, cb):
+        if cb not in self._listeners[name]:
+            raise RuntimeError('Listener not connected: %s' % name)
+        self._listeners[name].remove(cb)
+        _Listenable.stats['removed'] += 1
+
+    def _has(self, name, cb):
+        return cb in self._listeners[name]
+
+    def _notify(self, name):
+        for cb in list(self._listeners[name]):
+            _Listenable.stats['notified'] += 1
+            cb()
+
+    def listener_count(self, name=None):
+        """Number of connected listeners, optionally for one property"""
+        if name is not None:
+            return len(self._listeners[name])
+        return sum(len(cbs) for cbs in self._listeners.values())
+
+
+def _observable(name):
+    """Property that notifies its listeners when the value changes"""
+    attr = '_' + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        if getattr(self, attr) != value:
+            setattr(self, attr, value)
+            self._notify(name)
+
+    return property(getter, setter)
+
+
+class DeviceParameter(_Listenable):
+    _listenable = ('value',)
+
+    def __init__(self, name, value=0.0, min=0.0, max=1.0):
+        _Listenable.__init__(self)
+        self.name = name
+        self._value = value
+        self.min = min
+        self.max = max
+        self.native_feedback = []  # MIDI map feedback of mapped controls (not script listeners)
+
+    def _get_value(self):
+        return self._value
+
+    def _set_value(self, value):
+        if self._value != value:
+            self._value = value
+            self._notify('value')
+            for send_feedback in list(self.native_feedback):
+                send_feedback()
+
+    value = property(_get_value, _set_value)
+
+
+class MixerDevice(object):
+
+    def __init__(self, num_sends=2):
+        self.volume = DeviceParameter('Track Volume', 0.85)
+        self.panning = DeviceParameter('Track Panning', 0.0, -1.0, 1.0)
+        self.sends = tuple(DeviceParameter('Send %s' % chr(65 + i)) for i in range(num_sends))
+
+
+class Clip(_Listenable):
+    _listenable = ('playing_status', 'color', 'name')
+    color = _observable('color')
+    name = _observable('name')
+
+    def __init__(self, canonical_parent, color=0xFF0000, name=''):
+        _Listenable.__init__(self)
+        self.canonical_parent = canonical_parent
+        self._color = color
+        self._name = name
+        self.is_playing = False
+        self.is_recording = False
+        self.is_triggered = False
+
+    def _set_playing(self, playing, recording=False):
+        if (self.is_playing, self.is_recording) != (playing, recording):
+            self.is_playing = playing
+            self.is_recording = recording
+            self._notify('playing_status')
+
+    def fire(self):
+        self.canonical_parent.fire()
+
+    def stop(self):
+        self._set_playing(False)
+
+
+class ClipSlot(_Listenable):
+    _listenable = ('has_clip', 'playing_status')
+
+    def __init__(self, track):
+        _Listenable.__init__(self)
+        self.canonical_parent = track
+        self.clip = None
+        self.fire_count = 0
+
+    @property
+    def has_clip(self):
+        return self.clip is not None
+
+    def create_clip(self, color=0xFF0000):
+        self.clip = Clip(self, color)
+        self._notify('has_clip')
+        return self.clip
+
+    def delete_clip(self):
+        if self.clip is not None:
+            self.clip = None
+            self._notify('has_clip')
+
+    def fire(self):
+        """Launch immediately (no quantization); stops other clips on the track"""
+        self.fire_count += 1
+        for slot in self.canonical_parent.clip_slots:
+            if slot is not self and slot.clip is not None:
+                slot.clip._set_playing(False)
+        if self.clip is not None:
+            self.clip._set_playing(True)
+
+
+class Track(_Listenable):
+    _listenable = ('mute', 'solo', 'arm', 'name', 'color', 'clip_slots')
+    mute = _observable('mute')
+    arm = _observable('arm')
+    name = _observable('name')
+
+    def __init__(self, song, name, num_scenes, can_be_armed=True, num_sends=2):
+        _Listenable.__init__(self)
+        self.canonical_parent = song
+        self._name = name
+        self._mute = False
+        self._solo = False
+        self._arm = False
+        self.can_be_armed = can_be_armed
+        self.mixer_device = MixerDevice(num_sends)
+        self._clip_slots = [ClipSlot(self) for _ in range(num_scenes)]
+
+    @property
+    def clip_slots(self):
+        # Live hands out a fresh vector proxy on every access
+        return tuple(self._clip_slots)
+
+    def _get_solo(self):
+        return self._solo
+
+    def _set_solo(self, value):
+        if self._solo != value:
+            self._solo = value
+            self._notify('solo')
+            song = self.canonical_parent
+            if value and song.exclusive_solo:
+                for other in song._tracks:
+                    if other is not self:
+                        other.solo = False
+
+    solo = property(_get_solo, _set_solo)
+
+
+class Scene(_Listenable):
+    _listenable = ('name',)
+    name = _observable('name')
+
+    def __init__(self, song, name):
+        _Listenable.__init__(self)
+        self.canonical_parent = song
+        self._name = name
+
+    @property
+    def clip_slots(self):
+        idx = self.canonical_parent._scenes.index(self)
+        return tuple(t._clip_slots[idx] for t in self.canonical_parent._tracks)
+
+    def fire(self):
+        for slot in self.clip_slots:
+            if slot.has_clip:
+                slot.fire()
+
+
+class SongView(_Listenable):
+    _listenable = ('selected_track', 'selected_scene')
+    selected_track = _observable('selected_track')
+    selected_scene = _observable('selected_scene')
+
+    def __init__(self):
+        _Listenable.__init__(self)
+        self._selected_track = None
+        self._selected_scene = None
+
+
+class Song(_Listenable):
+    _listenable = ('tracks', 'scenes', 'visible_tracks', 'is_playing')
+
+    def __init__(self):
+        _Listenable.__init__(self)
+        self._tracks = []
+        self._scenes = []
+        self.view = SongView()
+        self.exclusive_solo = True
+        self.return_tracks = ()
+        self.master_track = None
+        self.track_access_count = 0
+
+    @property
+    def tracks(self):
+        # Live hands out a fresh vector proxy on every access
+        self.track_access_count += 1
+        return tuple(self._tracks)
+
+    @property
+    def visible_tracks(self):
+        return tuple(self._tracks)
+
+    @property
+    def scenes(self):
+        return tuple(self._scenes)
+
+    def create_track(self, index=-1, can_be_armed=True):
+        if index < 0:
+            index = len(self._tracks)
+        track = Track(self, '%d Track' % (len(self._tracks) + 1), len(self._scenes), can_be_armed)
+        self._tracks.insert(index, track)
+        self._notify('tracks')
+        self._notify('visible_tracks')
+        return track
+
+    def delete_track(self, index):
+        del self._tracks[index]
+        self._notify('tracks')
+        self._notify('visible_tracks')
+
+    def create_scene(self, index=-1):
+        if index < 0:
+            index = len(self._scenes)
+        scene = Scene(self, str(len(self._scenes) + 1))
+        self._scenes.insert(index, scene)
+        for track in self._tracks:
+            track._clip_slots.insert(index, ClipSlot(track))
+            track._notify('clip_slots')
+        self._notify('scenes')
+        return scene
+
+    def delete_scene(self, index):
+        del self._scenes[index]
+        for track in self._tracks:
+            del track._clip_slots[index]
+            track._notify('clip_slots')
+        self._notify('scenes')
+
+
+def listener_stats():
+    """Copy of the song-wide listener counters"""
+    return dict(_Listenable.stats)
+
+
+def make_song(num_tracks=8, num_scenes=4, clip_density=0.5, seed=0):
+    """Build a song with a deterministic pseudo-random spread of clips"""
+    song = Song()
+    for i in range(num_scenes):
+        song._scenes.append(Scene(song, str(i + 1)))
+    for i in range(num_tracks):
+        song._tracks.append(Track(song, '%d Track' % (i + 1), num_scenes, can_be_armed=(i % 5 != 4)))
+    state = seed or 1
+    for t, track in enumerate(song._tracks):
+        for s, slot in enumerate(track._clip_slots):
+            # Small LCG keeps layouts reproducible without touching global random state
+            state = (state * 1103515245 + 12345) & 0x7FFFFFFF
+            if (state % 1000) < clip_density * 1000:
+                slot.clip = Clip(slot, color=state & 0xFFFFFF)
+    return song
+
+
+class MidiMap(object):
+    """Records the forwarding requests made from build_midi_map"""
+
+    forwarded = []
+
+    @staticmethod
+    def forward_midi_note(script_handle, midi_map_handle, channel, note):
+        MidiMap.forwarded.append(('note', channel, note))
+        return True
+
+    @staticmethod
+    def forward_midi_cc(script_handle, midi_map_handle, channel, cc, *a):
+        MidiMap.forwarded.append(('cc', channel, cc))
+        return True
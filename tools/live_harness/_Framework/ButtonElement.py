@@ -0,0 +1,20 @@
+"""
+Fake _Framework.ButtonElement
+"""
+from .InputControlElement import InputControlElement
+
+
+class ButtonElement(InputControlElement):
+
+    def __init__(self, is_momentary, msg_type, channel, identifier, *a, **k):
+        super(ButtonElement, self).__init__(msg_type, channel, identifier, *a, **k)
+        self._is_momentary = bool(is_momentary)
+
+    def is_momentary(self):
+        return self._is_momentary
+
+    def turn_on(self):
+        self.send_value(127)
+
+    def turn_off(self):
+        self.send_value(0)
@@ -0,0 +1,116 @@
+"""
+Fake _Framework.ControlSurface
+Records outgoing MIDI and routes incoming MIDI to registered elements
+"""
+from contextlib import contextmanager
+
+_guard_stack = []
+_last_surface = [None]
+
+
+def current_surface():
+    if _guard_stack:
+        return _guard_stack[-1]
+    return _last_surface[0]
+
+
+def register_control(control):
+    surface = current_surface()
+    if surface is not None:
+        surface._controls.append(control)
+    return surface
+
+
+class ControlSurface(object):
+
+    def __init__(self, c_instance, *a, **k):
+        self._c_instance = c_instance
+        self._controls = []
+        self._scheduled = []
+        self._highlighting_session_component = None
+        self._midi_map_requested = False
+        self.midi_map_builds = 0
+        _last_surface[0] = self
+
+    def song(self):
+        return self._c_instance.song()
+
+    def application(self):
+        return None
+
+    @contextmanager
+    def component_guard(self):
+        _guard_stack.append(self)
+        try:
+            yield
+        finally:
+            _guard_stack.pop()
+
+    def log_message(self, *message):
+        self._c_instance.log_message(' '.join(str(m) for m in message))
+
+    def show_message(self, message):
+        self._c_instance.show_message(message)
+
+    def schedule_message(self, delay_in_ticks, callback, parameter=None):
+        self._scheduled.append([delay_in_ticks, callback, parameter])
+
+    def update_display(self):
+        due = [s for s in self._scheduled if s[0] <= 1]
+        self._scheduled = [s for s in self._scheduled if s[0] > 1]
+        for s in self._scheduled:
+            s[0] -= 1
+        for _, callback, parameter in due:
+            if parameter is None:
+                callback()
+            else:
+                callback(parameter)
+
+    def set_highlighting_session_component(self, session_component):
+        self._highlighting_session_component = session_component
+
+    def request_rebuild_midi_map(self):
+        # Live rebuilds after the current script callback returns (process_midi_map_request)
+        self._midi_map_requested = True
+
+    def process_midi_map_request(self):
+        """What Live does once a script callback has returned - one rebuild for any number of requests"""
+        if self._midi_map_requested:
+            self._midi_map_requested = False
+            self.midi_map_builds += 1
+            self.build_midi_map(None)
+
+    def build_midi_map(self, midi_map_handle):
+        # _install_mapping calls Live.MidiMap.send_feedback_for_parameter for each mapping it installs
+        for control in self._controls:
+            if getattr(control, 'mapped_parameter', None) and control.mapped_parameter() is not None:
+                control.send_native_feedback()
+
+    def _send_midi(self, midi_event_bytes, optimized=True):
+        self._c_instance.send_midi(tuple(midi_event_bytes))
+        return True
+
+    def receive_midi(self, midi_bytes):
+        if len(midi_bytes) != 3:
+            self.handle_sysex(midi_bytes)
+            return
+        status = midi_bytes[0]
+        kind = status & 0xF0
+        channel = status & 0x0F
+        value = midi_bytes[2] if len(midi_bytes) > 2 else 0
+        if kind == 0x80:
+            kind, value = 0x90, 0
+        for control in list(self._controls):
+            if (control.status_byte() & 0xF0 == kind and control.message_channel() == channel
+                    and control.message_identifier() == midi_bytes[1]):
+                control.receive_value(value)
+
+    def handle_sysex(self, midi_bytes):
+        pass
+
+    def disconnect(self):
+        for control in self._controls:
+            control.disconnect()
+        self._controls = []
+        if _last_surface[0] is self:
+            _last_surface[0] = None
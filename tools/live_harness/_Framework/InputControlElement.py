@@ -0,0 +1,129 @@
+"""
+Fake _Framework.InputControlElement
+"""
+from . import ControlSurface as _surface
+
+MIDI_NOTE_TYPE = 0
+MIDI_CC_TYPE = 1
+MIDI_PB_TYPE = 2
+MIDI_SYSEX_TYPE = 3
+MIDI_INVALID_TYPE = 4
+
+MIDI_NOTE_ON_STATUS = 144
+MIDI_NOTE_OFF_STATUS = 128
+MIDI_CC_STATUS = 176
+MIDI_PB_STATUS = 224
+
+_STATUS_FOR_TYPE = {MIDI_NOTE_TYPE: MIDI_NOTE_ON_STATUS,
+                    MIDI_CC_TYPE: MIDI_CC_STATUS,
+                    MIDI_PB_TYPE: MIDI_PB_STATUS}
+
+
+class InputControlElement(object):
+    """Element bound to one (type, channel, identifier) MIDI address"""
+
+    def __init__(self, msg_type, channel, identifier, *a, **k):
+        self._msg_type = msg_type
+        self._msg_channel = channel
+        self._msg_identifier = identifier
+        self._value_listeners = []
+        self._last_sent_value = -1
+        self._parameter_to_map_to = None
+        self._receiving = False
+        self._mapping_feedback_delay = 0
+        self._surface = _surface.register_control(self)
+
+    def message_type(self):
+        return self._msg_type
+
+    def message_channel(self):
+        return self._msg_channel
+
+    def message_identifier(self):
+        return self._msg_identifier
+
+    def status_byte(self):
+        return _STATUS_FOR_TYPE[self._msg_type] + self._msg_channel
+
+    def add_value_listener(self, callback, identify_sender=False):
+        if self.value_has_listener(callback):
+            raise RuntimeError('Listener already connected')
+        self._value_listeners.append((callback, identify_sender))
+
+    def remove_value_listener(self, callback):
+        self._value_listeners = [(cb, ids) for cb, ids in self._value_listeners if cb != callback]
+
+    def value_has_listener(self, callback):
+        return any(cb == callback for cb, _ in self._value_listeners)
+
+    def set_feedback_delay(self, delay):
+        # -1 maps the control without feedback
+        self._mapping_feedback_delay = delay
+
+    def connect_to(self, parameter):
+        # Live maps the control with feedback on the next map rebuild: the value is
+        # sent when the mapping is installed and on every change after that
+        if parameter is self._parameter_to_map_to:
+            return
+        self.release_parameter()
+        self._parameter_to_map_to = parameter
+        if parameter is not None:
+            parameter.native_feedback.append(self._send_native_feedback)
+        if self._surface is not None:
+            self._surface.request_rebuild_midi_map()
+
+    def release_parameter(self):
+        param = self._parameter_to_map_to
+        if param is not None and self._send_native_feedback in param.native_feedback:
+            param.native_feedback.remove(self._send_native_feedback)
+        self._parameter_to_map_to = None
+
+    def _send_native_feedback(self):
+        """Feedback Live's MIDI map sends itself - straight to the port, never through the script"""
+        param = self._parameter_to_map_to
+        if param is None or self._receiving or self._surface is None or self._mapping_feedback_delay < 0:
+            return
+        value = int(round((param.value - param.min) / float(param.max - param.min) * 127))
+        self._surface._c_instance.send_midi((self.status_byte(), self._msg_identifier, value))
+
+    def send_native_feedback(self):
+        """What Live.MidiMap.send_feedback_for_parameter does while the map is rebuilt"""
+        self._send_native_feedback()
+
+    def mapped_parameter(self):
+        return self._parameter_to_map_to
+
+    def receive_value(self, value):
+        # Live's MIDI map moves the mapped parameter before Python sees the value
+        param = self._parameter_to_map_to
+        if param is not None:
+            # No feedback back to the control that moved the parameter
+            self._receiving = True
+            try:
+                param.value = param.min + (param.max - param.min) * value / 127.0
+            finally:
+                self._receiving = False
+        for callback, identify_sender in list(self._value_listeners):
+            if identify_sender:
+                callback(value, self)
+            else:
+                callback(value)
+
+    def send_value(self, value, force=False):
+        # Data bytes are recorded as given; the scripts' color path sends full 8-bit values
+        value = int(value)
+        if force or value != self._last_sent_value:
+            self._last_sent_value = value
+            self.send_midi((self.status_byte(), self._msg_identifier, value))
+
+    def send_midi(self, message):
+        if self._surface is None:
+            raise AssertionError('Element is not registered with a control surface')
+        return self._surface._send_midi(message)
+
+    def clear_send_cache(self):
+        self._last_sent_value = -1
+
+    def disconnect(self):
+        self._value_listeners = []
+        self.release_parameter()
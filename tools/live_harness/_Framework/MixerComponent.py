@@ -0,0 +1,67 @@
+"""
+Fake _Framework.MixerComponent
+Binds strip controls to the parameters of the tracks under the current offset
+"""
+from . import ControlSurface as _surface
+
+
+class ChannelStripComponent(object):
+
+    def __init__(self):
+        self._track = None
+        self._volume_control = None
+        self._pan_control = None
+        self._send_controls = ()
+
+    def set_track(self, track):
+        self._track = track
+        self.update()
+
+    def set_volume_control(self, control):
+        self._volume_control = control
+        self.update()
+
+    def set_pan_control(self, control):
+        self._pan_control = control
+        self.update()
+
+    def set_send_controls(self, controls):
+        self._send_controls = tuple(controls or ())
+        self.update()
+
+    def update(self):
+        track = self._track
+        device = track.mixer_device if track is not None else None
+        if self._volume_control is not None:
+            self._volume_control.connect_to(device.volume if device else None)
+        if self._pan_control is not None:
+            self._pan_control.connect_to(device.panning if device else None)
+        sends = device.sends if device else ()
+        for i, control in enumerate(self._send_controls):
+            if control is not None:
+                control.connect_to(sends[i] if i < len(sends) else None)
+
+
+class MixerComponent(object):
+
+    def __init__(self, num_tracks, num_returns=0, *a, **k):
+        self._track_offset = 0
+        self._channel_strips = [ChannelStripComponent() for _ in range(num_tracks)]
+        self._surface = _surface.current_surface()
+        self._reassign_tracks()
+
+    def channel_strip(self, index):
+        return self._channel_strips[index]
+
+    def set_track_offset(self, new_offset):
+        self._track_offset = new_offset
+        self._reassign_tracks()
+
+    def _reassign_tracks(self):
+        tracks = self._surface.song().tracks if self._surface else ()
+        for i, strip in enumerate(self._channel_strips):
+            idx = self._track_offset + i
+            strip.set_track(tracks[idx] if idx < len(tracks) else None)
+
+    def disconnect(self):
+        pass
@@ -0,0 +1,35 @@
+"""
+Fake _Framework.SessionComponent
+"""
+
+
+class SessionComponent(object):
+
+    def __init__(self, num_tracks=0, num_scenes=0, *a, **k):
+        self._num_tracks = num_tracks
+        self._num_scenes = num_scenes
+        self._track_offset = 0
+        self._scene_offset = 0
+        self._highlighting_enabled = False
+
+    def width(self):
+        return self._num_tracks
+
+    def height(self):
+        return self._num_scenes
+
+    def set_offsets(self, track_offset, scene_offset):
+        self._track_offset = track_offset
+        self._scene_offset = scene_offset
+
+    def track_offset(self):
+        return self._track_offset
+
+    def scene_offset(self):
+        return self._scene_offset
+
+    def set_highlighting_enabled(self, enabled):
+        self._highlighting_enabled = enabled
+
+    def disconnect(self):
+        pass
@@ -0,0 +1,4 @@
+"""
+Fake _Framework
+Headless stand-ins for the Ableton _Framework classes used by the scripts
+"""
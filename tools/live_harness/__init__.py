@@ -0,0 +1,144 @@
+"""
+Headless harness for the Grid remote scripts
+Loads a script variant against the fake Live/_Framework and records its MIDI
+"""
+import importlib.util
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    # Makes the fake _Framework importable the way Live exposes the real one
+    sys.path.insert(0, _HERE)
+
+from Live import make_song  # noqa: E402
+
+SCRIPTS_DIR = os.environ.get('GRID_SCRIPTS_DIR') or os.path.join(os.path.dirname(os.path.dirname(_HERE)), 'scripts')
+VARIANTS = ('Mixer_Launch_Control', '8Track_Mixer', '4Track_Mixer')
+
+
+def split_messages(sent):
+    """Recorded send_midi calls as message tuples - Live takes one message per call"""
+    return [tuple(data) for data in sent]
+
+
+class FakeCInstance(object):
+    """Stand-in for the c_instance Live passes to create_instance"""
+
+    def __init__(self, song):
+        self._song = song
+        self.sent = []
+        self.shown = []
+        self.log = []
+
+    def song(self):
+        return self._song
+
+    def handle(self):
+        return id(self)
+
+    def send_midi(self, midi_bytes):
+        # Live takes exactly one message per call - a whole SysEx or one channel message
+        if midi_bytes and midi_bytes[0] == 0xF0:
+            valid = midi_bytes[-1] == 0xF7
+        else:
+            valid = 1 < len(midi_bytes) <= 3 and midi_bytes[0] & 0x80
+        if not valid:
+            raise ValueError('send_midi takes a single MIDI message, got %r' % (tuple(midi_bytes),))
+        self.sent.append(midi_bytes)
+
+    def show_message(self, message):
+        self.shown.append(message)
+
+    def log_message(self, message):
+        self.log.append(message)
+
+
+def load_variant(variant, constants=None):
+    """
+    Import scripts/<variant> as a fresh package and return the module -
+    constants {name: value} overrides its constants.py before anything imports it
+    """
+    path = os.path.join(SCRIPTS_DIR, variant)
+    name = 'grid_variant_' + variant.lower()
+    for mod in [m for m in sys.modules if m == name or m.startswith(name + '.')]:
+        del sys.modules[mod]
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(path, '__init__.py'), submodule_search_locations=[path])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    if constants:
+        variant_constants = importlib.import_module(name + '.constants')
+        for key, value in constants.items():
+            if not hasattr(variant_constants, key):
+                raise AttributeError('%s has no constant %s' % (variant, key))
+            setattr(variant_constants, key, value)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Harness(object):
+    """Drives one control surface instance and counts the MIDI it emits"""
+
+    def __init__(self, variant='Mixer_Launch_Control', song=None, setup=True, constants=None, **song_args):
+        self.song = song if song is not None else make_song(**song_args)
+        self.c_instance = FakeCInstance(self.song)
+        self.module = load_variant(variant, constants)
+        self.surface = self.module.create_instance(self.c_instance)
+        if setup:
+            self.run_setup()
+
+    @property
+    def sent(self):
+        return self.c_instance.sent
+
+    def run_setup(self):
+        """Tick until the delayed setup has run and its output has gone out"""
+        while self.surface._scheduled:
+            self.tick()
+        self.drain()
+
+    def tick(self, count=1):
+        for _ in range(count):
+            self._live_callback(self.surface.update_display)
+
+    def drain(self, max_ticks=100):
+        """Tick until a tick sends nothing (output held back by a per-tick budget has gone out)"""
+        for _ in range(max_ticks):
+            sent = len(self.c_instance.sent)
+            self.tick()
+            if len(self.c_instance.sent) == sent:
+                return
+
+    def messages(self):
+        """Recorded MIDI as single messages (see split_messages)"""
+        return split_messages(self.c_instance.sent)
+
+    def reset(self):
+        """Forget recorded MIDI; returns what was recorded"""
+        sent = self.c_instance.sent
+        self.c_instance.sent = []
+        return sent
+
+    def capture(self, action, *args, **kwargs):
+        """Run action, drain its output, return the messages it produced"""
+        self.reset()
+        self._live_callback(action, *args, **kwargs)
+        self.drain()
+        return split_messages(self.reset())
+
+    def note(self, channel, note, velocity=127):
+        self._live_callback(self.surface.receive_midi, (0x90 | channel, note, velocity))
+
+    def cc(self, channel, cc, value):
+        self._live_callback(self.surface.receive_midi, (0xB0 | channel, cc, value))
+
+    def _live_callback(self, callback, *args, **kwargs):
+        """Run callback the way Live runs script callbacks - a requested map rebuild follows it"""
+        self.surface.process_midi_map_request()
+        result = callback(*args, **kwargs)
+        self.surface.process_midi_map_request()
+        return result
+
+    def disconnect(self):
+        self.surface.disconnect()
@@ -0,0 +1,36 @@
+"""
+python -m live_harness [variant ...]
+Loads each script variant headlessly and prints the MIDI cost of common actions
+"""
+import sys
+
+from . import Harness, VARIANTS
+
+
+def main(variants):
+    for variant in variants:
+        h = Harness(variant, num_tracks=16, num_scenes=8)
+        song = h.song
+        slot = song.tracks[1].clip_slots[1]
+        clip = slot.clip or slot.create_clip()
+        actions = (
+            ('setup', None),
+            ('track right', lambda: h.note(0, 45)),
+            ('scene down', lambda: h.note(0, 47)),
+            ('trigger CC', lambda: h.cc(0, 127, 127)),
+            ('mute track', lambda: setattr(song.tracks[2], 'mute', True)),
+            ('scene launch', lambda: song.scenes[1].fire()),
+            ('clip color', lambda: setattr(clip, 'color', 0x123456)),
+            ('add track', lambda: song.create_track()),
+            ('delete track', lambda: song.delete_track(0)),
+            ('add scene', lambda: song.create_scene()),
+        )
+        print(variant)
+        for name, action in actions:
+            sent = h.messages() if action is None else h.capture(action)
+            print('  %-14s %4d messages' % (name, len(sent)))
+        h.disconnect()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or VARIANTS)